@@ -12,8 +12,6 @@ load_dotenv(Path(__file__).resolve().parent / ".env")
 
 import streamlit as st
 
-from ui.pages import assessment, portfolio, hypothetical
-
 st.set_page_config(
     page_title="Wealthsimple Options",
     page_icon="📈",
@@ -29,16 +27,42 @@ _defaults = {
     "hyp_positions":       [],
     "live_prices":         {},
 }
-for key, val in _defaults.items():
-    if key not in st.session_state:
-        st.session_state[key] = val
+# One sentinel check per rerun instead of a membership test per key.
+if "_init_done" not in st.session_state:
+    st.session_state.update(_defaults)
+    st.session_state["_init_done"] = True
 
 # ── Navigation ────────────────────────────────────────────────────────────────
-pages = {
-    "assessment":   st.Page(assessment.show,   title="Assessment",           icon="📋", url_path="assessment"),
-    "portfolio":    st.Page(portfolio.show,     title="Portfolio",            icon="📊", url_path="portfolio"),
-    "hypothetical": st.Page(hypothetical.show,  title="Position Builder", icon="🔬", url_path="hypothetical"),
-}
+# Page modules are imported inside their entry points, so each rerun only
+# loads the module graph of the page actually being rendered.
+def _assessment() -> None:
+    from ui.pages import assessment
+    assessment.show()
+
+
+def _portfolio() -> None:
+    from ui.pages import portfolio
+    portfolio.show()
+
+
+def _hypothetical() -> None:
+    from ui.pages import hypothetical
+    hypothetical.show()
+
+
+def _build_pages() -> dict:
+    """
+    Page objects, built on every rerun. Not cached across sessions: st.Page
+    carries per-run navigation state, so sessions must not share instances.
+    """
+    return {
+        "assessment":   st.Page(_assessment,   title="Assessment",           icon="📋", url_path="assessment"),
+        "portfolio":    st.Page(_portfolio,     title="Portfolio",            icon="📊", url_path="portfolio"),
+        "hypothetical": st.Page(_hypothetical,  title="Position Builder", icon="🔬", url_path="hypothetical"),
+    }
+
+
+pages = _build_pages()
 
 # Store Page objects so any page can call st.switch_page
 st.session_state["_pages"] = pages
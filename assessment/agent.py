@@ -11,13 +11,35 @@ writing strength/weakness descriptions) happens between turns 2 and 3 without
 any additional tool calls.
 """
 
+import copy
+import functools
 import json
 
-from assessment.questions import AVAILABLE_ACTIONS
-from assessment.tools import TOOLS, dispatch
+from assessment.questions import AVAILABLE_ACTIONS, CATEGORY_PRIORITY
+from assessment.tools import (
+    LAST_PROFILE,
+    TOOLS,
+    check_action_permission,
+    create_paper_portfolio,
+    dispatch,
+)
+from core.jsonio import dumps, loads, write_json
 from core.runner import run_agent
 
-SYSTEM_PROMPT = f"""You are an options knowledge assessment agent for Wealthsimple.
+
+@functools.lru_cache(maxsize=1)
+def _system_prompt() -> str:
+    """
+    Build the system prompt on first use.
+
+    Deferred out of module import so loading this module (e.g. on a cold
+    Streamlit start) doesn't pay for rendering it; later calls hit the cache.
+    """
+    actions_block = json.dumps(dict(AVAILABLE_ACTIONS), indent=2)
+    priority_block = "\n".join(
+        f'      {cat:<21}→ "{priority}"' for cat, priority in CATEGORY_PRIORITY.items()
+    )
+    return f"""You are an options knowledge assessment agent for Wealthsimple.
 
 Your task: process a completed 12-question survey and produce a structured investor profile.
 
@@ -25,8 +47,10 @@ Your task: process a completed 12-question survey and produce a structured inves
 
 CALL 1 — analyze_all_answers(answers)
   All 12 answers are available upfront (single-page survey). Process them all at once.
+  Answer keys arrive as JSON strings ("1"–"12"); pass them through unchanged.
   You receive: per-question results (selected text, correct text, concept, is_correct)
-  plus weighted scores and category breakdowns.
+  plus weighted scores and category breakdowns. Incorrect answers also carry
+  all_choices — every option's text — for reading the misconception.
 
 CALL 2 — classify_level(score)
   Pass the 'score' object from call 1. You receive the level and final score.
@@ -58,9 +82,7 @@ REASONING — before call 3, infer strengths and weaknesses:
     Each misconception field should describe the pattern of thinking that the
     wrong answers reveal — one sentence, no instrument or Greek names.
     Set priority by which category the wrong answers are concentrated in:
-      fundamental_safety   → "high"
-      strategy_application → "medium"
-      advanced_risk        → "low"
+{priority_block}
     If errors span categories, use the highest priority among them.
 
 CALL 3 — store_investor_profile(profile)
@@ -93,9 +115,14 @@ CALL 3 — store_investor_profile(profile)
   }}
 
 Available actions by level:
-{json.dumps(AVAILABLE_ACTIONS, indent=2)}
+{actions_block}
 """
 
+# Profiles from earlier runs, keyed by (sorted answers, filepath). Identical
+# submissions (Streamlit reruns, demo replays) skip the agent loop entirely.
+_PROFILE_CACHE: dict[tuple, dict] = {}
+_PROFILE_CACHE_MAX = 128
+
 
 def run_assessment_agent(answers: dict, filepath: str = "profiles/investor_profile.json") -> dict:
     """
@@ -106,24 +133,85 @@ def run_assessment_agent(answers: dict, filepath: str = "profiles/investor_profi
         filepath: where to write the profile JSON
 
     Returns:
-        The investor profile dict (also written to filepath).
+        The investor profile dict (also written to filepath). Repeat calls
+        with the same answers and filepath return a copy of the cached profile
+        without running the agent; filepath is still rewritten so it holds the profile
+        just returned.
     """
-    str_answers = {str(k): v for k, v in answers.items()}
+    cache_key = (tuple(sorted(answers.items())), filepath)
+    cached = _PROFILE_CACHE.get(cache_key)
+    if cached is not None:
+        write_json(filepath, cached)
+        return copy.deepcopy(cached)  # callers may edit their copy; the cache stays intact
 
     messages = [
         {
             "role": "user",
             "content": (
-                f"Survey answers: {json.dumps(str_answers)}\n"
+                f"Survey answers: {dumps(answers)}\n"
                 f"Save the profile to: {filepath}"
             ),
         }
     ]
 
-    run_agent(SYSTEM_PROMPT, TOOLS, dispatch, messages, label="assessment")
-
+    token = LAST_PROFILE.set(None)
     try:
-        with open(filepath) as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {"error": "Profile was not stored by the agent."}
+        run_agent(_system_prompt(), TOOLS, dispatch, messages, label="assessment")
+        profile = LAST_PROFILE.get()
+    finally:
+        LAST_PROFILE.reset(token)
+
+    if profile is None:
+        # Fall back to the file in case the profile was stored elsewhere. It
+        # may be left over from an earlier run, so it is not cached.
+        try:
+            with open(filepath, "rb") as f:
+                return loads(f.read())
+        except FileNotFoundError:
+            return {"error": "Profile was not stored by the agent."}
+
+    if len(_PROFILE_CACHE) >= _PROFILE_CACHE_MAX:
+        _PROFILE_CACHE.pop(next(iter(_PROFILE_CACHE)))
+    _PROFILE_CACHE[cache_key] = copy.deepcopy(profile)
+    return profile
+
+
+def gate_and_paper(profile: dict, attempted_action: str) -> dict:
+    """
+    Gate attempted_action at profile's assessed level and open a paper
+    portfolio for practising it.
+
+    Returns:
+        {"gate": ..., "paper": ...} — the results of check_action_permission
+        and create_paper_portfolio, unchanged.
+    """
+    return {
+        "gate": check_action_permission(attempted_action, profile["level"]),
+        "paper": create_paper_portfolio(profile, attempted_action),
+    }
+
+
+def assess_gate_and_paper(
+    answers: dict,
+    attempted_action: str,
+    filepath: str = "profiles/investor_profile.json",
+) -> dict:
+    """
+    Assess the survey, then run gate_and_paper at the assessed level — the
+    full flow behind the demo.
+
+    Lives here rather than in tools.py because it drives the agent, and this
+    module already imports the tools. Callers that want to start other work
+    as soon as the level is known can call run_assessment_agent and
+    gate_and_paper separately.
+
+    Returns:
+        {"profile": ..., "gate": ..., "paper": ...} — the results of
+        run_assessment_agent, check_action_permission and
+        create_paper_portfolio, unchanged. gate and paper are None when the
+        assessment returned an error.
+    """
+    profile = run_assessment_agent(answers, filepath)
+    if "error" in profile:
+        return {"profile": profile, "gate": None, "paper": None}
+    return {"profile": profile, **gate_and_paper(profile, attempted_action)}
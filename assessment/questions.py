@@ -3,18 +3,69 @@ Static data: the 12-question bank and level-based available actions.
 
 Keeping data here means tools.py and agent.py can import it without
 depending on each other, and a future questions v2 only touches this file.
+
+Both tables are read-only so callers can share them freely without
+defensive copies. QUESTIONS is a tuple of frozen Question records ordered
+by question number (QUESTIONS[n - 1], or get_question(n)); fields are read
+as attributes (q.weight, q.choices). AVAILABLE_ACTIONS is a MappingProxyType.
 """
 
-QUESTIONS: dict[int, dict] = {
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from types import MappingProxyType
+
+# Category names are interned so every question, counter key and lookup
+# shares one string object and equality short-circuits on identity.
+CATEGORIES: tuple[str, ...] = tuple(
+    sys.intern(c) for c in ("fundamental_safety", "strategy_application", "advanced_risk")
+)
+
+# Weakness priority by category — fundamentals gaps matter most.
+CATEGORY_PRIORITY: MappingProxyType = MappingProxyType({
+    CATEGORIES[0]: "high",
+    CATEGORIES[1]: "medium",
+    CATEGORIES[2]: "low",
+})
+
+
+# Choices are stored as a 4-tuple in letter order; letter L is index ord(L) - 65.
+CHOICE_LETTERS: tuple[str, ...] = ("A", "B", "C", "D")
+
+
+@dataclass(frozen=True, slots=True)
+class Question:
+    text: str
+    correct: str
+    choices: tuple[str, ...]
+    category: str
+    weight: float
+    concept: str
+    concept_label: str
+
+    def as_dict(self) -> dict:
+        """Plain-dict form for JSON serialisation."""
+        return {
+            "text": self.text,
+            "correct": self.correct,
+            "choices": dict(zip(CHOICE_LETTERS, self.choices)),
+            "category": self.category,
+            "weight": self.weight,
+            "concept": self.concept,
+            "concept_label": self.concept_label,
+        }
+
+
+_QUESTIONS: dict[int, dict] = {
     1: {
         "text": "What is your maximum loss when buying a call option?",
         "correct": "B",
-        "choices": {
-            "A": "Unlimited",
-            "B": "The premium you paid",
-            "C": "The difference between strike and stock price",
-            "D": "The current stock price",
-        },
+        "choices": (
+            "Unlimited",
+            "The premium you paid",
+            "The difference between strike and stock price",
+            "The current stock price",
+        ),
         "category": "fundamental_safety",
         "weight": 2,
         "concept": "basic_risk_understanding",
@@ -26,12 +77,12 @@ QUESTIONS: dict[int, dict] = {
             " okay selling at $190. What should you do?"
         ),
         "correct": "B",
-        "choices": {
-            "A": "Buy Apple call options",
-            "B": "Sell 2 Apple $190 covered calls",
-            "C": "Buy Apple put options",
-            "D": "Sell Apple and buy options instead",
-        },
+        "choices": (
+            "Buy Apple call options",
+            "Sell 2 Apple $190 covered calls",
+            "Buy Apple put options",
+            "Sell Apple and buy options instead",
+        ),
         "category": "fundamental_safety",
         "weight": 2,
         "concept": "covered_call_strategy",
@@ -40,12 +91,12 @@ QUESTIONS: dict[int, dict] = {
     3: {
         "text": "Options lose value as expiration approaches due to:",
         "correct": "B",
-        "choices": {
-            "A": "Delta decay",
-            "B": "Time decay (Theta)",
-            "C": "Volatility changes",
-            "D": "Interest rate changes",
-        },
+        "choices": (
+            "Delta decay",
+            "Time decay (Theta)",
+            "Volatility changes",
+            "Interest rate changes",
+        ),
         "category": "fundamental_safety",
         "weight": 2,
         "concept": "time_decay_theta",
@@ -58,12 +109,12 @@ QUESTIONS: dict[int, dict] = {
             " What's your best option?"
         ),
         "correct": "B",
-        "choices": {
-            "A": "Buy more tech stocks when they drop",
-            "B": "Buy protective puts on your holdings",
-            "C": "Sell covered calls",
-            "D": "Move everything to cash",
-        },
+        "choices": (
+            "Buy more tech stocks when they drop",
+            "Buy protective puts on your holdings",
+            "Sell covered calls",
+            "Move everything to cash",
+        ),
         "category": "fundamental_safety",
         "weight": 2,
         "concept": "portfolio_protection",
@@ -72,12 +123,12 @@ QUESTIONS: dict[int, dict] = {
     5: {
         "text": "Delta measures:",
         "correct": "B",
-        "choices": {
-            "A": "Time until expiration",
-            "B": "How much option price changes when stock moves $1",
-            "C": "Volatility sensitivity",
-            "D": "Interest rate sensitivity",
-        },
+        "choices": (
+            "Time until expiration",
+            "How much option price changes when stock moves $1",
+            "Volatility sensitivity",
+            "Interest rate sensitivity",
+        ),
         "category": "strategy_application",
         "weight": 1.5,
         "concept": "delta_greek",
@@ -89,12 +140,12 @@ QUESTIONS: dict[int, dict] = {
             " Microsoft is now at $325 and expires tomorrow. What should you expect?"
         ),
         "correct": "B",
-        "choices": {
-            "A": "Keep the stock and the $3",
-            "B": "Your shares will likely be called away, but you keep the $3",
-            "C": "You'll lose money",
-            "D": "Nothing happens automatically",
-        },
+        "choices": (
+            "Keep the stock and the $3",
+            "Your shares will likely be called away, but you keep the $3",
+            "You'll lose money",
+            "Nothing happens automatically",
+        ),
         "category": "strategy_application",
         "weight": 1.5,
         "concept": "assignment_mechanics",
@@ -106,12 +157,12 @@ QUESTIONS: dict[int, dict] = {
             " Which strategy makes sense?"
         ),
         "correct": "C",
-        "choices": {
-            "A": "Wait for the stock to hit $400",
-            "B": "Buy Netflix call options",
-            "C": "Sell Netflix $400 cash-secured puts",
-            "D": "Buy Netflix stock now",
-        },
+        "choices": (
+            "Wait for the stock to hit $400",
+            "Buy Netflix call options",
+            "Sell Netflix $400 cash-secured puts",
+            "Buy Netflix stock now",
+        ),
         "category": "strategy_application",
         "weight": 1.5,
         "concept": "cash_secured_puts",
@@ -120,12 +171,12 @@ QUESTIONS: dict[int, dict] = {
     8: {
         "text": "Before earnings announcements, option prices typically:",
         "correct": "B",
-        "choices": {
-            "A": "Decrease due to uncertainty",
-            "B": "Increase due to higher implied volatility",
-            "C": "Stay the same",
-            "D": "Only change if earnings are good",
-        },
+        "choices": (
+            "Decrease due to uncertainty",
+            "Increase due to higher implied volatility",
+            "Stay the same",
+            "Only change if earnings are good",
+        ),
         "category": "strategy_application",
         "weight": 1.5,
         "concept": "implied_volatility_earnings",
@@ -137,12 +188,12 @@ QUESTIONS: dict[int, dict] = {
             " in-the-money. Your priority should be:"
         ),
         "correct": "C",
-        "choices": {
-            "A": "Let them all expire automatically",
-            "B": "Close the most profitable ones first",
-            "C": "Manage each based on assignment risk and portfolio impact",
-            "D": "Roll them all to next month",
-        },
+        "choices": (
+            "Let them all expire automatically",
+            "Close the most profitable ones first",
+            "Manage each based on assignment risk and portfolio impact",
+            "Roll them all to next month",
+        ),
         "category": "advanced_risk",
         "weight": 1,
         "concept": "expiration_management",
@@ -151,12 +202,12 @@ QUESTIONS: dict[int, dict] = {
     10: {
         "text": "High 'gamma' exposure in your portfolio means:",
         "correct": "B",
-        "choices": {
-            "A": "Your positions decay slowly",
-            "B": "Small stock moves can cause large option value swings",
-            "C": "You're protected against volatility",
-            "D": "Your positions are very safe",
-        },
+        "choices": (
+            "Your positions decay slowly",
+            "Small stock moves can cause large option value swings",
+            "You're protected against volatility",
+            "Your positions are very safe",
+        ),
         "category": "advanced_risk",
         "weight": 1,
         "concept": "gamma_exposure",
@@ -168,12 +219,12 @@ QUESTIONS: dict[int, dict] = {
             " $400/$380 puts, SPY at $425). This strategy profits if:"
         ),
         "correct": "B",
-        "choices": {
-            "A": "SPY moves strongly in either direction",
-            "B": "SPY stays between $400-$450",
-            "C": "SPY only goes up",
-            "D": "Volatility increases dramatically",
-        },
+        "choices": (
+            "SPY moves strongly in either direction",
+            "SPY stays between $400-$450",
+            "SPY only goes up",
+            "Volatility increases dramatically",
+        ),
         "category": "advanced_risk",
         "weight": 1,
         "concept": "multi_leg_strategies",
@@ -185,12 +236,12 @@ QUESTIONS: dict[int, dict] = {
             " the stock only dropping 5%. This is most likely due to:"
         ),
         "correct": "B",
-        "choices": {
-            "A": "Time decay acceleration",
-            "B": "Implied volatility crush",
-            "C": "Interest rate changes",
-            "D": "Trading volume decrease",
-        },
+        "choices": (
+            "Time decay acceleration",
+            "Implied volatility crush",
+            "Interest rate changes",
+            "Trading volume decrease",
+        ),
         "category": "advanced_risk",
         "weight": 1,
         "concept": "volatility_crush",
@@ -198,7 +249,50 @@ QUESTIONS: dict[int, dict] = {
     },
 }
 
-AVAILABLE_ACTIONS: dict[str, list[str]] = {
+# Question numbers are dense 1..12, so a tuple indexed by n - 1 replaces the
+# dict: lookups are a plain array index rather than a hash and probe.
+QUESTIONS: tuple[Question, ...] = tuple(
+    Question(**{
+        **q,
+        "category": sys.intern(q["category"]),
+        "concept": sys.intern(q["concept"]),
+    })
+    for _, q in sorted(_QUESTIONS.items())
+)
+
+
+def get_question(n: int) -> Question:
+    """Question by its 1-based survey number."""
+    return QUESTIONS[n - 1]
+
+
+def choice_index(letter: str) -> int:
+    """0-based index of a choice letter, or -1 if it is not one of CHOICE_LETTERS."""
+    i = ord(letter) - 65 if len(letter) == 1 else -1
+    return i if 0 <= i < len(CHOICE_LETTERS) else -1
+
+
+def choice_text(q: Question, letter: str) -> str:
+    """Text of the choice labelled letter; raises KeyError for an unknown letter."""
+    i = choice_index(letter)
+    if i < 0:
+        raise KeyError(letter)
+    return q.choices[i]
+
+
+# Column views of QUESTIONS, indexed by question_number - 1. Scoring reads
+# these instead of going through each Question record for every answer.
+CORRECT: tuple[str, ...] = tuple(q.correct for q in QUESTIONS)
+CORRECT_IDX: tuple[int, ...] = tuple(choice_index(q.correct) for q in QUESTIONS)
+CATEGORY: tuple[str, ...] = tuple(q.category for q in QUESTIONS)
+WEIGHT: tuple[float, ...] = tuple(q.weight for q in QUESTIONS)
+CONCEPT: tuple[str, ...] = tuple(q.concept for q in QUESTIONS)
+
+# Fixed totals for a complete survey; the question bank never changes at runtime.
+MAX_WEIGHTED_SCORE: float = sum(WEIGHT)
+CATEGORY_TOTALS: dict[str, int] = dict(Counter(CATEGORY))
+
+_AVAILABLE_ACTIONS: dict[str, list[str]] = {
     "beginner": [
         "Educational option chains with explanations",
         "Buy calls/puts (max 2% position size)",
@@ -226,3 +320,7 @@ AVAILABLE_ACTIONS: dict[str, list[str]] = {
         "Advanced portfolio analytics",
     ],
 }
+
+AVAILABLE_ACTIONS: MappingProxyType = MappingProxyType({
+    level: tuple(actions) for level, actions in _AVAILABLE_ACTIONS.items()
+})
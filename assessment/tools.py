@@ -1,11 +1,12 @@
 """
 Tool implementations and schemas for the assessment agent.
 
-Five tools in total:
+Six tools in total:
   Assessment pipeline (3 tools, run once per survey):
     1. analyze_all_answers    — scores + per-question analysis in one call
     2. classify_level         — applies the weighted classification algorithm
     3. store_investor_profile — persists the final JSON
+  plus get_question_choices — on-demand choice texts for a single question
 
   Action gate (2 tools, called when a user attempts a feature):
     4. check_action_permission  — returns a notification (advisory | warning | null)
@@ -15,78 +16,210 @@ Keeping implementations here (separate from agent.py) means they can be
 unit-tested independently and reused by other agents later.
 """
 
-import json
-from datetime import datetime
+import functools
+from collections import Counter
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from itertools import compress
 from pathlib import Path
+from types import MappingProxyType
+
+from assessment.questions import (
+    CATEGORY,
+    CATEGORY_TOTALS,
+    CHOICE_LETTERS,
+    CORRECT_IDX,
+    MAX_WEIGHTED_SCORE,
+    QUESTIONS,
+    WEIGHT,
+    choice_index,
+)
+from core.gates import (
+    COMPILED_CONTEXT_GATES,
+    DEFAULT_STRATEGY_RANK,
+    LEVEL_NAMES,
+    LEVEL_ORDER,
+    RANK_ONLY_CONTEXT_KEYS,
+    STRATEGY_DESC,
+    STRATEGY_RANK,
+    UNDEFINED_RISK_STRATEGIES,
+)
+from core.jsonio import dumps, write_json
+from portfolio.positions import ALL_POSITIONS, ETF_IDS, PORTFOLIO
+
+
+# The profile most recently stored in this context. run_assessment_agent reads
+# it back instead of re-opening and re-parsing the file it was written to.
+LAST_PROFILE: ContextVar[dict | None] = ContextVar("last_profile", default=None)
+
+# Rank of the top level — no gate can require more than this.
+_MAX_RANK = len(LEVEL_NAMES) - 1
+
+
+# The question ids a complete survey must answer, in order.
+_QIDS: list[int] = list(range(1, len(QUESTIONS) + 1))
+
+# Category names in a fixed order; compact results refer to them by index.
+_CATEGORY_NAMES: tuple[str, ...] = tuple(CATEGORY_TOTALS)
+
+# Asset types in a fixed order; compact paper portfolios refer to them by index.
+_ASSET_TYPES = ("etf", "stock")
+
+
+def _result_template(n: int, q, compact: bool) -> dict:
+    return {
+        "question_id": n,
+        "question": q.text,
+        "selected": None,
+        "selected_text": None,
+        "correct_answer": q.correct,
+        "correct_text": q.choices[CORRECT_IDX[n - 1]],
+        "is_correct": None,
+        **(
+            {"cat_id": _CATEGORY_NAMES.index(q.category)}
+            if compact else {"category": q.category}
+        ),
+        "weight": q.weight,
+        "concept": q.concept,
+        "concept_label": q.concept_label,
+    }
+
 
-from assessment.questions import QUESTIONS
-from core.gates import STRATEGY_GATES, CONTEXT_GATES, LEVEL_ORDER
-from portfolio.positions import PORTFOLIO
+# Static per-question fields of an analyze_all_answers result, built once —
+# one set per output mode. The per-answer fields are placeholders here
+# (keeping the key order) and are filled in on a copy.
+_RESULT_TEMPLATES: tuple[dict, ...] = tuple(
+    _result_template(n, q, compact=False) for n, q in enumerate(QUESTIONS, 1)
+)
+_COMPACT_TEMPLATES: tuple[dict, ...] = tuple(
+    _result_template(n, q, compact=True) for n, q in enumerate(QUESTIONS, 1)
+)
+
+# Letter-keyed choices per question, attached to incorrect results only.
+# Shared between results — treat as read-only.
+_ALL_CHOICES: tuple[dict, ...] = tuple(
+    dict(zip(CHOICE_LETTERS, q.choices)) for q in QUESTIONS
+)
 
 
 # ─── Implementations ──────────────────────────────────────────────────────────
 
-def analyze_all_answers(answers: dict) -> dict:
+def analyze_all_answers(answers: dict, compact: bool = False) -> dict:
     """
     Processes all 12 answers in one shot.
 
     For each question returns: the question text, selected choice text, correct
-    choice text, whether it's correct, the concept tested, the scoring weight,
-    and the full choices dict so the agent can reason about specific misconceptions.
+    choice text, whether it's correct, the concept tested and the scoring weight.
+    Incorrect answers also carry the full choices dict (all_choices) so the agent
+    can reason about specific misconceptions.
 
     Also computes weighted scores and per-category breakdowns so classify_level
     has everything it needs without an extra round-trip.
+
+    With compact=True each result carries a "cat_id" index into a top-level
+    "categories" list instead of repeating the category name, which shrinks
+    the payload. The score block (and so classify_level) is the same either way.
+
+    Raises ValueError unless answers covers each question exactly once with a
+    valid choice letter.
     """
-    question_results = []
-    total_weight = 0.0
-    earned_weight = 0.0
+    # Validate the shape once up front; past this point every answer is known
+    # good and the survey is complete, so the body below has no defensive paths.
+    if len(answers) != len(QUESTIONS):
+        raise ValueError(f"Expected {len(QUESTIONS)} answers, got {len(answers)}")
+    try:
+        items = sorted((int(k), v.upper()) for k, v in answers.items())
+    except (AttributeError, TypeError, ValueError):
+        raise ValueError(
+            f"Answers must map question numbers to choice letters, got {answers!r}"
+        ) from None
+    if [qid for qid, _ in items] != _QIDS:
+        raise ValueError(f"Answers must cover questions 1–{len(QUESTIONS)} exactly once")
+
+    selected = [sel for _, sel in items]
+    picked = [choice_index(sel) for sel in selected]  # -1 for an unknown letter
+    bad = [f"{qid}={sel}" for (qid, sel), p in zip(items, picked) if p < 0]
+    if bad:
+        raise ValueError(f"Invalid choices: {', '.join(bad)}")
+
+    # Score column-wise: one correctness mask over small-int choice indexes,
+    # then masked reductions over the weight and category columns.
+    mask = [p == c for p, c in zip(picked, CORRECT_IDX)]
+    earned_weight = sum(compress(WEIGHT, mask), 0.0)
+    correct_by_cat = Counter(compress(CATEGORY, mask))
+    raw_correct = sum(mask)
+
     category_breakdown: dict[str, dict] = {
-        "fundamental_safety":   {"correct": 0, "total": 0},
-        "strategy_application": {"correct": 0, "total": 0},
-        "advanced_risk":        {"correct": 0, "total": 0},
+        cat: {"correct": correct_by_cat[cat], "total": total}
+        for cat, total in CATEGORY_TOTALS.items()
     }
-    raw_correct = 0
-
-    for qid_str, answer in answers.items():
-        q = QUESTIONS[int(qid_str)]
-        selected = answer.upper()
-        is_correct = selected == q["correct"]
-        weight = q["weight"]
-        cat = q["category"]
-
-        total_weight += weight
-        category_breakdown[cat]["total"] += 1
-        if is_correct:
-            earned_weight += weight
-            category_breakdown[cat]["correct"] += 1
-            raw_correct += 1
-
-        question_results.append({
-            "question_id": int(qid_str),
-            "question": q["text"],
-            "selected": selected,
-            "selected_text": q["choices"].get(selected, "Unknown choice"),
-            "correct_answer": q["correct"],
-            "correct_text": q["choices"][q["correct"]],
-            "is_correct": is_correct,
-            "category": cat,
-            "weight": weight,
-            "concept": q["concept"],
-            "concept_label": q["concept_label"],
-            "all_choices": q["choices"],
-        })
-
-    weighted_pct = round((earned_weight / total_weight) * 100, 1) if total_weight else 0.0
 
-    return {
+    templates = _COMPACT_TEMPLATES if compact else _RESULT_TEMPLATES
+    question_results = []
+    for i, (sel, p, is_correct) in enumerate(zip(selected, picked, mask)):
+        entry = templates[i].copy()
+        entry["selected"] = sel
+        entry["selected_text"] = QUESTIONS[i].choices[p]
+        entry["is_correct"] = is_correct
+        if not is_correct:
+            entry["all_choices"] = _ALL_CHOICES[i]
+        question_results.append(entry)
+
+    weighted_pct = round((earned_weight / MAX_WEIGHTED_SCORE) * 100, 1)
+
+    result = {
         "question_results": question_results,
         "score": {
             "raw_correct": raw_correct,
-            "total_questions": len(answers),
+            "total_questions": len(QUESTIONS),
             "weighted_score_pct": weighted_pct,
             "category_breakdown": category_breakdown,
         },
     }
+    if compact:
+        result["categories"] = list(_CATEGORY_NAMES)
+    return result
+
+
+def _classify_rule(fs: int, sa: int, ar: int, pct: float) -> str:
+    """The classification thresholds — the single source of truth for _LEVEL_TABLE."""
+    if fs >= 3 and sa >= 3 and ar >= 3 and pct > 75:
+        return "advanced"
+    if fs >= 3 and sa >= 2 and 50 <= pct <= 75:
+        return "intermediate"
+    return "beginner"
+
+
+# Per-category correct counts only matter up to 4 (the per-category question
+# count); the weighted % only matters as <50 / 50–75 / >75. Every input
+# combination therefore maps onto a 5×5×5×3 table built once from the rule.
+_PCT_BUCKET_SAMPLES = (0.0, 50.0, 100.0)
+_LEVEL_TABLE: dict[tuple[int, int, int, int], str] = {
+    (fs, sa, ar, b): _classify_rule(fs, sa, ar, _PCT_BUCKET_SAMPLES[b])
+    for fs in range(5)
+    for sa in range(5)
+    for ar in range(5)
+    for b in range(3)
+}
+
+
+def _clamp(n: int) -> int:
+    return 0 if n < 0 else (4 if n > 4 else n)
+
+
+def get_question_choices(question_id: int) -> dict:
+    """
+    Returns the full letter-keyed choices for one question. analyze_all_answers
+    only attaches them to incorrect answers; this fetches them on demand.
+    """
+    if not 1 <= question_id <= len(QUESTIONS):
+        raise ValueError(f"Unknown question_id: {question_id}")
+    return {
+        "question_id": question_id,
+        "question": QUESTIONS[question_id - 1].text,
+        "choices": _ALL_CHOICES[question_id - 1],
+    }
 
 
 def classify_level(score: dict) -> dict:
@@ -103,12 +236,8 @@ def classify_level(score: dict) -> dict:
     pct = score["weighted_score_pct"]
     raw = score["raw_correct"]
 
-    if fs >= 3 and sa >= 3 and ar >= 3 and pct > 75:
-        level = "advanced"
-    elif fs >= 3 and sa >= 2 and 50 <= pct <= 75:
-        level = "intermediate"
-    else:
-        level = "beginner"
+    pct_bucket = 0 if pct < 50 else (1 if pct <= 75 else 2)
+    level = _LEVEL_TABLE[(_clamp(fs), _clamp(sa), _clamp(ar), pct_bucket)]
 
     return {
         "level": level,
@@ -119,83 +248,110 @@ def classify_level(score: dict) -> dict:
 
 def store_investor_profile(profile: dict, filepath: str = "profiles/investor_profile.json") -> dict:
     """Persists the investor profile as a JSON file."""
+    from datetime import datetime
+
     Path(filepath).parent.mkdir(parents=True, exist_ok=True)
     profile["generated_at"] = datetime.now().isoformat()
-    with open(filepath, "w") as f:
-        json.dump(profile, f, indent=2)
+    write_json(filepath, profile)
+    LAST_PROFILE.set(profile)
     return {"success": True, "filepath": filepath}
 
 
 # ─── Action Gate ──────────────────────────────────────────────────────────────
 
-def _highest_context_level(context: dict) -> str | None:
+def _evaluate_context_gates(context: dict) -> tuple[int, list[tuple]]:
     """
-    Returns the highest level required by any context gate that fires,
-    or None if none fire. Skips is_undefined_risk — that is handled
-    separately as a warning trigger, not a level gap signal.
+    Single pass over the compiled context gates. Returns the highest rank
+    required by any gate that fires (-1 if none fire) and the fired gates as
+    (rank, condition_key, reason). is_undefined_risk is not among them — it
+    is handled separately as a warning trigger, not a level gap signal.
     """
     if not context:
-        return None
+        return -1, []
 
-    highest_rank = -1
-    highest_level = None
-
-    for gate in CONTEXT_GATES:
-        if gate["condition"] == "is_undefined_risk":
-            continue  # handled separately as a warning, not an advisory gap
-
-        key = gate["condition"]
+    fired = []
+    for key, op_fn, threshold, rank, reason in COMPILED_CONTEXT_GATES:
         val = context.get(key)
-        if val is None:
-            continue
-
-        op = gate["operator"]
-        fired = False
-        if op == ">=" and isinstance(val, (int, float)):
-            fired = val >= gate["threshold"]
-        elif op == "between" and isinstance(val, (int, float)):
-            lo, hi = gate["threshold"]
-            fired = lo <= val <= hi
-        elif op == "is_true":
-            fired = bool(val)
-
-        if fired:
-            rank = LEVEL_ORDER[gate["min_level"]]
-            if rank > highest_rank:
-                highest_rank = rank
-                highest_level = gate["min_level"]
-
-    return highest_level
-
-
-def _build_suggestions(action_label: str, investor_rank: int) -> list:
-    next_level = {0: "intermediate", 1: "advanced"}.get(investor_rank, "advanced")
-    return [
-        {
-            "action": "learn_more",
-            "label": f"Learn about {action_label}",
-            "description": (
-                f"Read a guide on how {action_label} works, "
-                f"including real examples and risk/reward tradeoffs."
-            ),
-        },
-        {
-            "action": "take_assessment",
-            "label": f"Take the {next_level} assessment",
-            "description": (
-                f"Complete the {next_level}-level knowledge check (~5 minutes). "
-                f"It gives you a clearer picture of where your gaps are."
-            ),
-        },
-        {
-            "action": "paper_trading",
-            "label": "Try it in paper trading first",
-            "description": (
-                "Practice this strategy on an exact replica of your portfolio "
-                "with no real money at risk."
-            ),
-        },
-    ]
+        if val is not None and op_fn(val, threshold):
+            fired.append((rank, key, reason))
+
+    return max((r for r, _, _ in fired), default=-1), fired
+
+
+@dataclass(frozen=True, slots=True)
+class Notification:
+    """An advisory or warning raised by check_action_permission."""
+    level: str                     # "advisory" | "warning"
+    headline: str
+    suggestions: tuple             # read-only mappings, shared across cache hits
+    risks: tuple | None = None     # warning only
+    gaps: tuple | None = None      # advisory only
+
+    def as_dict(self) -> dict:
+        """Plain-dict form for JSON serialisation; omits the unused list."""
+        d = {"level": self.level, "headline": self.headline}
+        if self.risks is not None:
+            d["risks"] = self.risks
+        if self.gaps is not None:
+            d["gaps"] = self.gaps
+        d["suggestions"] = [dict(s) for s in self.suggestions]
+        return d
+
+
+def _to_json(obj):
+    """dumps() default hook for the dataclasses tools return."""
+    if isinstance(obj, Notification):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Suggestion text, formatted once per (action_label, next_level) on first use.
+# (action, label template, description template)
+_SUGGESTION_TEMPLATES: tuple[tuple[str, str, str], ...] = (
+    (
+        "learn_more",
+        "Learn about {action_label}",
+        "Read a guide on how {action_label} works, "
+        "including real examples and risk/reward tradeoffs.",
+    ),
+    (
+        "take_assessment",
+        "Take the {next_level} assessment",
+        "Complete the {next_level}-level knowledge check (~5 minutes). "
+        "It gives you a clearer picture of where your gaps are.",
+    ),
+)
+
+# Has no varying fields, so one mapping is shared by every suggestion list.
+_PAPER_TRADING_SUGGESTION = MappingProxyType({
+    "action": "paper_trading",
+    "label": "Try it in paper trading first",
+    "description": (
+        "Practice this strategy on an exact replica of your portfolio "
+        "with no real money at risk."
+    ),
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _build_suggestions(action_label: str, investor_rank: int) -> tuple:
+    # Cached and shared across notifications — a tuple of read-only mappings so
+    # callers can't append to it or edit a suggestion in place.
+    fields = {
+        "action_label": action_label,
+        "next_level": LEVEL_NAMES[min(investor_rank + 1, _MAX_RANK)],
+    }
+    return (
+        *(
+            MappingProxyType({
+                "action": action,
+                "label": label.format_map(fields),
+                "description": desc.format_map(fields),
+            })
+            for action, label, desc in _SUGGESTION_TEMPLATES
+        ),
+        _PAPER_TRADING_SUGGESTION,
+    )
 
 
 def check_action_permission(
@@ -229,24 +385,52 @@ def check_action_permission(
     Returns dict with:
         attempted_action  str
         investor_level    str
-        notification      dict | None
+        notification      Notification | None
           level           "advisory" | "warning"
           headline        str
-          risks           list[str]   (warning only)
-          gaps            list[str]   (advisory only — which knowledge areas to build)
-          suggestions     list[dict]  (learn_more, take_assessment, paper_trading)
+          risks           tuple[str]  (warning only)
+          gaps            tuple[str]  (advisory only — which knowledge areas to build)
+          suggestions     tuple[Mapping] (learn_more, take_assessment, paper_trading)
+
+    The notification is a pure function of the inputs and is cached per
+    (action, level, context); each call gets its own outer dict around the
+    shared, immutable Notification.
     """
-    ctx = context or {}
+    # None-valued keys are treated as absent by every gate, so dropping them
+    # lets equivalent contexts share one cache entry.
+    ctx_key = tuple(sorted(
+        (k, v) for k, v in (context or {}).items() if v is not None
+    ))
+    try:
+        hash(ctx_key)
+    except TypeError:
+        # Unhashable context values (outside the schema) skip the cache.
+        notification = _evaluate_permission.__wrapped__(attempted_action, investor_level, ctx_key)
+    else:
+        notification = _evaluate_permission(attempted_action, investor_level, ctx_key)
+    return {
+        "attempted_action": attempted_action,
+        "investor_level": investor_level,
+        "notification": notification,
+    }
+
+
+@functools.lru_cache(maxsize=512)
+def _evaluate_permission(
+    attempted_action: str, investor_level: str, ctx_key: tuple
+) -> Notification | None:
+    """Cached core of check_action_permission; ctx_key is the sorted context items."""
+    ctx = dict(ctx_key)
     investor_rank = LEVEL_ORDER.get(investor_level, 0)
     action_label = attempted_action.replace("_", " ")
 
-    strategy_gate = STRATEGY_GATES.get(attempted_action, {})
-    strategy_level = strategy_gate.get("min_level", "advanced")
-    strategy_rank = LEVEL_ORDER[strategy_level]
+    strategy_rank = STRATEGY_RANK.get(attempted_action, DEFAULT_STRATEGY_RANK)
+    strategy_desc = STRATEGY_DESC.get(attempted_action, "")
+    strategy_undefined = attempted_action in UNDEFINED_RISK_STRATEGIES
 
     # ── Warning: undefined/unlimited risk ─────────────────────────────────────
     is_undefined = (
-        strategy_gate.get("risk") == "undefined"
+        strategy_undefined
         or ctx.get("is_undefined_risk", False)
     )
 
@@ -257,98 +441,88 @@ def check_action_permission(
             "Margin calls can force position closure at an unfavourable price.",
             "Volatile underlyings can gap through your strike overnight.",
         ]
-        if strategy_gate.get("risk") == "undefined":
-            risks.append(strategy_gate.get("description", ""))
+        if strategy_undefined:
+            risks.append(strategy_desc)
+
+        return Notification(
+            level="warning",
+            headline=f"{action_label.title()} carries unlimited risk",
+            risks=tuple(r for r in risks if r),
+            suggestions=_build_suggestions(action_label, investor_rank),
+        )
 
-        return {
-            "attempted_action": attempted_action,
-            "investor_level": investor_level,
-            "notification": {
-                "level": "warning",
-                "headline": f"{action_label.title()} carries unlimited risk",
-                "risks": [r for r in risks if r],
-                "suggestions": _build_suggestions(action_label, investor_rank),
-            },
-        }
+    # ── Fast path: no gap is possible ─────────────────────────────────────────
+    # Nothing ranks above the top level, so its investors never trail a
+    # requirement; and with no context only the strategy's own level counts.
+    if investor_rank >= _MAX_RANK or (not ctx and strategy_rank <= investor_rank):
+        return None
 
     # ── Advisory: assessed level below what this strategy typically requires ──
-    context_level = _highest_context_level(ctx)
-    context_rank = LEVEL_ORDER[context_level] if context_level else -1
+    context_rank, fired_gates = _evaluate_context_gates(ctx)
     required_rank = max(strategy_rank, context_rank)
-    required_level = [k for k, v in LEVEL_ORDER.items() if v == required_rank][0]
+    required_level = LEVEL_NAMES[required_rank]
 
     has_gap = investor_rank < required_rank
 
     if has_gap:
         gaps = []
         if strategy_rank > investor_rank:
-            desc = strategy_gate.get("description", "")
             gaps.append(
-                f"{action_label.title()} is typically used by {strategy_level} investors. "
-                + (desc if desc else "")
+                f"{action_label.title()} is typically used by "
+                f"{LEVEL_NAMES[strategy_rank]} investors. {strategy_desc}"
+            )
+        if context_rank > investor_rank:
+            gaps.extend(
+                reason for rank, key, reason in fired_gates
+                if rank > investor_rank and key not in RANK_ONLY_CONTEXT_KEYS
             )
-        if context_level and context_rank > investor_rank:
-            for gate in CONTEXT_GATES:
-                if gate["condition"] == "is_undefined_risk":
-                    continue
-                key = gate["condition"]
-                val = ctx.get(key)
-                if val is None:
-                    continue
-                op, threshold = gate["operator"], gate.get("threshold")
-                if op == ">=" and isinstance(val, (int, float)):
-                    fired = val >= threshold
-                elif op == "between" and isinstance(val, (int, float)):
-                    lo, hi = threshold
-                    fired = lo <= val <= hi
-                else:
-                    fired = False
-                if fired and LEVEL_ORDER[gate["min_level"]] > investor_rank:
-                    gaps.append(gate["reason"])
 
-        return {
-            "attempted_action": attempted_action,
-            "investor_level": investor_level,
-            "notification": {
-                "level": "advisory",
-                "headline": (
-                    f"This is typically a {required_level}-level strategy — "
-                    f"here's what to keep in mind"
-                ),
-                "gaps": gaps,
-                "suggestions": _build_suggestions(action_label, investor_rank),
-            },
-        }
+        return Notification(
+            level="advisory",
+            headline=(
+                f"This is typically a {required_level}-level strategy — "
+                f"here's what to keep in mind"
+            ),
+            gaps=tuple(gaps),
+            suggestions=_build_suggestions(action_label, investor_rank),
+        )
 
     # ── No friction ───────────────────────────────────────────────────────────
-    return {
-        "attempted_action": attempted_action,
-        "investor_level": investor_level,
-        "notification": None,
-    }
+    return None
 
 
 def create_paper_portfolio(
     investor_profile: dict,
     attempted_action: str,
     filepath: str | None = None,
+    compact: bool = False,
 ) -> dict:
     """
     Creates a paper trading portfolio that mirrors the investor's real holdings.
 
     Each position is cloned at its current price with an empty paper_trades list.
     The investor can then practice the attempted_action without risking real capital.
+
+    With compact=True positions carry an "at" index into a top-level
+    "asset_types" list instead of an "asset_type" string.
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    from datetime import datetime
+
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     if filepath is None:
         filepath = f"profiles/paper_{timestamp}.json"
 
-    all_positions = PORTFOLIO["etfs"] + PORTFOLIO["stocks"]
-    paper_positions = [
-        {
+    if compact:
+        type_key, etf_type, stock_type = "at", 0, 1
+    else:
+        type_key, etf_type, stock_type = "asset_type", *_ASSET_TYPES
+
+    def _clone(p: dict, asset_type) -> dict:
+        return {
             "ticker": p["ticker"],
             "name": p["name"],
-            "asset_type": "etf" if p in PORTFOLIO["etfs"] else "stock",
+            type_key: asset_type,
             "shares": p["shares"],
             "entry_price": p["price"],       # locked at creation time
             "current_price": p["price"],     # updated by paper trading UI
@@ -357,12 +531,14 @@ def create_paper_portfolio(
             "contracts_available": p["contracts_available"],
             "paper_trades": [],              # options trades the user opens in paper mode
         }
-        for p in all_positions
+
+    paper_positions = [
+        _clone(p, etf_type if id(p) in ETF_IDS else stock_type) for p in ALL_POSITIONS
     ]
 
     paper_portfolio = {
         "paper_portfolio_id": f"paper_{timestamp}",
-        "created_at": datetime.now().isoformat(),
+        "created_at": now.isoformat(),
         "investor_level": investor_profile.get("level", "beginner"),
         "attempted_action": attempted_action,
         "mode": "paper_trading",
@@ -376,41 +552,74 @@ def create_paper_portfolio(
             f"before using real capital."
         ),
     }
+    if compact:
+        paper_portfolio["asset_types"] = list(_ASSET_TYPES)
 
     Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-    with open(filepath, "w") as f:
-        json.dump(paper_portfolio, f, indent=2)
+    write_json(filepath, paper_portfolio)
 
     return {"success": True, "filepath": filepath, "paper_portfolio": paper_portfolio}
 
 
 # ─── Dispatch ─────────────────────────────────────────────────────────────────
 
+# One handler per tool, each unpacking its own tool_input. Named functions
+# rather than lambdas so tracebacks point at the tool that failed.
+
+def _d_analyze(ti: dict) -> dict:
+    return analyze_all_answers(ti["answers"], ti.get("compact", False))
+
+
+def _d_choices(ti: dict) -> dict:
+    return get_question_choices(int(ti["question_id"]))
+
+
+def _d_classify(ti: dict) -> dict:
+    return classify_level(ti["score"])
+
+
+def _d_store(ti: dict) -> dict:
+    return store_investor_profile(
+        ti["profile"], ti.get("filepath", "profiles/investor_profile.json")
+    )
+
+
+def _d_check(ti: dict) -> dict:
+    return check_action_permission(
+        ti["attempted_action"], ti["investor_level"], ti.get("context")
+    )
+
+
+def _d_paper(ti: dict) -> dict:
+    return create_paper_portfolio(
+        ti["investor_profile"],
+        ti["attempted_action"],
+        ti.get("filepath"),
+        ti.get("compact", False),
+    )
+
+
+# Tool name → handler, built once; dispatch is a single dict lookup.
+_DISPATCH: dict[str, Callable[[dict], dict]] = {
+    "analyze_all_answers": _d_analyze,
+    "get_question_choices": _d_choices,
+    "classify_level": _d_classify,
+    "store_investor_profile": _d_store,
+    "check_action_permission": _d_check,
+    "create_paper_portfolio": _d_paper,
+}
+
+
 def dispatch(name: str, tool_input: dict) -> str:
-    if name == "analyze_all_answers":
-        result = analyze_all_answers(tool_input["answers"])
-    elif name == "classify_level":
-        result = classify_level(tool_input["score"])
-    elif name == "store_investor_profile":
-        result = store_investor_profile(
-            tool_input["profile"],
-            tool_input.get("filepath", "profiles/investor_profile.json"),
-        )
-    elif name == "check_action_permission":
-        result = check_action_permission(
-            tool_input["attempted_action"],
-            tool_input["investor_level"],
-            tool_input.get("context"),
-        )
-    elif name == "create_paper_portfolio":
-        result = create_paper_portfolio(
-            tool_input["investor_profile"],
-            tool_input["attempted_action"],
-            tool_input.get("filepath"),
-        )
-    else:
+    fn = _DISPATCH.get(name)
+    if fn is None:
         result = {"error": f"Unknown tool: {name}"}
-    return json.dumps(result)
+    else:
+        try:
+            result = fn(tool_input)
+        except ValueError as e:
+            result = {"error": str(e)}
+    return dumps(result, default=_to_json)
 
 
 # ─── Schemas ──────────────────────────────────────────────────────────────────
@@ -421,8 +630,10 @@ TOOLS = [
         "description": (
             "Process all 12 survey answers in one call. Returns per-question analysis "
             "(selected text, correct text, concept, whether correct) plus weighted scores "
-            "and category breakdowns. Call this first and once — all answers are available "
-            "upfront since the survey is completed on a single page."
+            "and category breakdowns. Incorrect answers also include all_choices, the "
+            "full A–D choice texts, for misconception analysis. Call this first and "
+            "once — all answers are available upfront since the survey is completed "
+            "on a single page."
         ),
         "input_schema": {
             "type": "object",
@@ -434,11 +645,36 @@ TOOLS = [
                         'e.g. {"1": "B", "2": "A", ..., "12": "C"}'
                     ),
                     "additionalProperties": {"type": "string"},
-                }
+                },
+                "compact": {
+                    "type": "boolean",
+                    "description": (
+                        "If true, each result has a cat_id index into a top-level "
+                        "categories list instead of a category name (default false)."
+                    ),
+                },
             },
             "required": ["answers"],
         },
     },
+    {
+        "name": "get_question_choices",
+        "description": (
+            "Return the full A–D choice texts for one question. Only needed for a "
+            "correctly answered question — incorrect answers already include "
+            "all_choices in the analyze_all_answers result."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "question_id": {
+                    "type": "integer",
+                    "description": "Question number, 1–12.",
+                }
+            },
+            "required": ["question_id"],
+        },
+    },
     {
         "name": "classify_level",
         "description": (
@@ -546,6 +782,13 @@ TOOLS = [
                     "type": "string",
                     "description": "Output path (auto-generated with timestamp if omitted).",
                 },
+                "compact": {
+                    "type": "boolean",
+                    "description": (
+                        "If true, positions have an 'at' index into a top-level "
+                        "asset_types list instead of an asset_type string (default false)."
+                    ),
+                },
             },
             "required": ["investor_profile", "attempted_action"],
         },
@@ -10,10 +10,20 @@ Two layers:
   STRATEGY_GATES  — named strategy → minimum level
   CONTEXT_GATES   — context signals (leg count, concurrency, etc.) → minimum level
   LEVEL_ORDER     — maps level names to sortable integers
+  LEVEL_NAMES     — the inverse: rank → level name
+
+Both gate tables are read-only (a MappingProxyType and a tuple). The
+derived lookups below them are built once at import:
+  STRATEGY_RANK / STRATEGY_DESC — per-strategy min-level rank and description
+  UNDEFINED_RISK_STRATEGIES     — strategies flagged risk="undefined"
+  COMPILED_CONTEXT_GATES        — CONTEXT_GATES pre-bound for evaluation
+  RANK_ONLY_CONTEXT_KEYS        — context gates that raise the level but list no gap
 """
 
+from types import MappingProxyType
+
 # Named strategy gates: what a user explicitly asks to do.
-STRATEGY_GATES: dict[str, dict] = {
+STRATEGY_GATES: MappingProxyType = MappingProxyType({
     # Beginner
     "buy_calls_puts": {
         "min_level": "beginner",
@@ -99,14 +109,14 @@ STRATEGY_GATES: dict[str, dict] = {
         "min_level": "advanced",
         "description": "Delta hedging, vega neutrality, portfolio-level Greeks rebalancing.",
     },
-}
+})
 
 # Context-based gates: triggered by *how* the investor is trading,
 # regardless of the named strategy. These reflect cognitive complexity,
 # not just product complexity.
 #
 # Format: {condition_key: value_threshold, min_level, reason}
-CONTEXT_GATES: list[dict] = [
+CONTEXT_GATES: tuple[dict, ...] = (
     # Leg count overrides (same-ticker depth)
     {
         "condition": "leg_count",
@@ -175,6 +185,64 @@ CONTEXT_GATES: list[dict] = [
             "which behaves very differently from single-expiry positions."
         ),
     },
-]
+)
 
 LEVEL_ORDER: dict[str, int] = {"beginner": 0, "intermediate": 1, "advanced": 2}
+LEVEL_NAMES: tuple[str, ...] = tuple(sorted(LEVEL_ORDER, key=LEVEL_ORDER.__getitem__))
+
+
+# ─── Derived strategy lookups ─────────────────────────────────────────────────
+# Unknown strategies are treated as advanced-only.
+DEFAULT_STRATEGY_RANK: int = LEVEL_ORDER["advanced"]
+
+STRATEGY_RANK: MappingProxyType = MappingProxyType({
+    k: LEVEL_ORDER[v["min_level"]] for k, v in STRATEGY_GATES.items()
+})
+STRATEGY_DESC: MappingProxyType = MappingProxyType({
+    k: v.get("description", "") for k, v in STRATEGY_GATES.items()
+})
+UNDEFINED_RISK_STRATEGIES: frozenset[str] = frozenset(
+    k for k, v in STRATEGY_GATES.items() if v.get("risk") == "undefined"
+)
+
+
+# ─── Compiled context gates ───────────────────────────────────────────────────
+# Each operator string maps to a small (value, threshold) -> bool function,
+# chosen once here so evaluating a gate is a single call with no dispatch.
+
+def _ge_num(val, threshold) -> bool:
+    return isinstance(val, (int, float)) and val >= threshold
+
+
+def _between_num(val, threshold) -> bool:
+    lo, hi = threshold
+    return isinstance(val, (int, float)) and lo <= val <= hi
+
+
+def _is_true(val, _threshold) -> bool:
+    return bool(val)
+
+
+_OPERATORS = {">=": _ge_num, "between": _between_num, "is_true": _is_true}
+
+# (condition_key, op_fn, threshold, min_level_rank, reason) per gate.
+# is_undefined_risk is left out — it is a warning trigger, not a level gate.
+COMPILED_CONTEXT_GATES: tuple[tuple, ...] = tuple(
+    (
+        gate["condition"],
+        _OPERATORS[gate["operator"]],
+        gate.get("threshold"),
+        LEVEL_ORDER[gate["min_level"]],
+        gate["reason"],
+    )
+    for gate in CONTEXT_GATES
+    if gate["condition"] != "is_undefined_risk"
+)
+
+# is_true gates (e.g. has_multiple_expirations) raise the required level when
+# they fire, but their reasons are not listed in an advisory's gaps.
+RANK_ONLY_CONTEXT_KEYS: frozenset[str] = frozenset(
+    gate["condition"]
+    for gate in CONTEXT_GATES
+    if gate["operator"] == "is_true" and gate["condition"] != "is_undefined_risk"
+)
@@ -0,0 +1,80 @@
+"""
+JSON encode/decode helpers shared by all agents.
+
+orjson is used when it is installed — it is a C-backed encoder several times
+faster than the stdlib on the nested dicts our tools produce. When it is not
+available these fall back to the stdlib json module, so orjson stays an
+optional dependency.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# Mode for newly created files; mkstemp's own default is 0600.
+_NEW_FILE_MODE = 0o644
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, default=None) -> str:
+    """
+    Serialise obj to a compact JSON string.
+
+    Non-string dict keys (e.g. int question numbers) are written as JSON
+    strings, matching the stdlib's behaviour. default, if given, converts
+    objects JSON does not support — dataclasses included, so both backends
+    produce the same output for them.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(obj, default=default, option=option).decode()
+    return json.dumps(obj, default=default)
+
+
+def loads(data: bytes | str):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _file_mode(path: Path) -> int:
+    """Permission bits for path: kept from the file being replaced, else _NEW_FILE_MODE."""
+    try:
+        return path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        return _NEW_FILE_MODE
+
+
+def write_json(filepath: str | Path, obj) -> None:
+    """
+    Write obj to filepath as 2-space-indented JSON.
+
+    The bytes go to a uniquely named temp file in the same directory that is
+    then os.replace()d over the target, so readers never see a half-written
+    file and concurrent writers to the same path do not collide.
+    """
+    path = Path(filepath)
+    if orjson is not None:
+        data = orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        )
+    else:
+        data = (json.dumps(obj, indent=2) + "\n").encode()
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), _file_mode(path))
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -4,10 +4,125 @@ Shared agentic loop for all agents in this project.
 Each agent supplies its own system prompt, tool schemas, and dispatch
 function. The runner drives the tool-use loop until the model signals
 end_turn (or an unexpected stop reason), then returns.
+
+The system prompt and tool schemas are identical on every turn, so both are
+marked as prompt-cache breakpoints: after the first turn they are served from
+Anthropic's prompt cache instead of being reprocessed.
+
+Responses are streamed, and each read-only tool_use block is dispatched the
+moment the model finishes writing it — tool work overlaps with the rest of
+the turn being generated instead of waiting for the whole message. Tools
+that write state (store_*, create_*) wait until the finished message has
+stop_reason == "tool_use": a turn cut off at max_tokens can end with a
+truncated input block, and that must never reach disk.
+
+An agent whose last step is a store-the-result tool can name it as
+final_tool: once that tool has run, the loop ends without sending its result
+back to the model for an acknowledgement turn.
 """
 
-import json
-from anthropic import Anthropic
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from core.jsonio import dumps
+
+MODEL = "claude-sonnet-4-6"
+
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Shared pool the streamed tool calls run on.
+_TOOL_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tool")
+
+_MISSING = object()
+
+# Tool-name prefixes of tools with side effects, started only once the turn is complete.
+_SIDE_EFFECT_PREFIXES = ("store_", "create_")
+
+# Created on first use, then reused by every agent call in the process.
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Return the process-wide Anthropic client, importing the SDK and building
+    the client on first use — importing this module (e.g. to reach the tool
+    code behind it) stays cheap when no agent is ever run.
+
+    Sharing one client keeps its HTTP connection pool warm, so later calls
+    skip the TCP/TLS handshake to the API.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from anthropic import Anthropic
+
+                _client = Anthropic()
+    return _client
+
+
+def _with_cache_breakpoints(system_prompt: str, tools: list) -> tuple[list, list]:
+    """Return (system, tools) with a cache_control breakpoint on the last block of each."""
+    system = [{"type": "text", "text": system_prompt, "cache_control": _CACHE_CONTROL}]
+    if tools:
+        tools = [*tools[:-1], {**tools[-1], "cache_control": _CACHE_CONTROL}]
+    return system, tools
+
+
+def _start_tool(block, dispatch) -> tuple:
+    """
+    Print the call and start it on the pool, in a copy of the caller's context.
+    Returns (block, context, future) for _finish_tools.
+    """
+    raw = dumps(block.input)  # serialised once for both preview and length
+    print(f"  → {block.name}({raw[:80]}{'…' if len(raw) > 80 else ''})")
+    ctx = contextvars.copy_context()
+    return block, ctx, _TOOL_POOL.submit(ctx.run, dispatch, block.name, block.input)
+
+
+def _copy_back(ctx) -> None:
+    """Copy ContextVar writes a tool made in its copied context into the caller's."""
+    for var, value in ctx.items():
+        if var.get(_MISSING) is not value:
+            var.set(value)
+
+
+def _drain(pending: list[tuple]) -> None:
+    """
+    Settle the tools a turn started before it ended without stop_reason tool_use.
+
+    Unstarted entries are skipped. Started ones are awaited so their
+    ContextVar writes are kept; their input may have been truncated, so a
+    tool that raised is reported and otherwise ignored, as the stop reason
+    already ends the run.
+    """
+    for block, ctx, future in pending:
+        if future is None:
+            continue
+        try:
+            future.result()
+        except Exception as e:
+            print(f"  ✗ {block.name} failed: {e!r}")
+            continue
+        _copy_back(ctx)
+
+
+def _finish_tools(pending: list[tuple]) -> list[dict]:
+    """
+    Wait for the started tools and build their tool_result blocks in order.
+
+    ContextVar writes a tool made in its copied context are copied back into
+    the caller's, in block order — the same end state as running the tools
+    one after another inline (e.g. the assessment agent's LAST_PROFILE).
+    """
+    results = []
+    for block, ctx, future in pending:
+        content = future.result()
+        _copy_back(ctx)
+        results.append({"type": "tool_result", "tool_use_id": block.id, "content": content})
+    return results
 
 
 def run_agent(
@@ -16,12 +131,14 @@ def run_agent(
     dispatch,
     messages: list,
     label: str = "agent",
-) -> None:
+    final_tool: str | None = None,
+) -> dict | None:
     """
-    Drive the tool-use loop until the model reaches end_turn.
+    Drive the tool-use loop until the model reaches end_turn, or final_tool runs.
 
     Mutates `messages` in place so the caller retains the full conversation
-    history if needed. Prints each tool call as it executes.
+    history if needed. Prints each tool call as it starts; tools requested in
+    the same turn run concurrently.
 
     Args:
         system_prompt: the agent's system prompt string
@@ -29,37 +146,57 @@ def run_agent(
         dispatch:      callable(name, tool_input) → JSON string
         messages:      list of message dicts; should contain the opening user turn
         label:         short name shown in the "Running…" line
+        final_tool:    name of a tool that ends the run once it has been dispatched
+
+    Returns:
+        The input the model passed to final_tool, or None if the run ended
+        without calling it.
     """
     print(f"Running {label}…\n")
-    client = Anthropic()
+    client = get_client()
+    system, cached_tools = _with_cache_breakpoints(system_prompt, tools)
 
     while True:
-        response = client.messages.create(
-            model="claude-sonnet-4-6",
+        # (block, context, future) per tool_use block; side-effecting tools
+        # hold (block, None, None) until the turn is known to be complete.
+        pending: list[tuple] = []
+        final_input = None
+        with client.messages.stream(
+            model=MODEL,
             max_tokens=8096,
-            system=system_prompt,
-            tools=tools,
+            system=system,
+            tools=cached_tools,
             messages=messages,
-        )
+        ) as stream:
+            for event in stream:
+                if event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                    block = event.content_block
+                    if block.name.startswith(_SIDE_EFFECT_PREFIXES):
+                        pending.append((block, None, None))
+                    else:
+                        pending.append(_start_tool(block, dispatch))
+                    if block.name == final_tool:
+                        final_input = block.input
+            response = stream.get_final_message()
 
         messages.append({"role": "assistant", "content": response.content})
 
         if response.stop_reason == "end_turn":
+            _drain(pending)
             print("Done.\n")
-            break
+            return None
 
         if response.stop_reason != "tool_use":
+            _drain(pending)
             print(f"Unexpected stop reason: {response.stop_reason}")
-            break
-
-        tool_results = []
-        for block in response.content:
-            if block.type == "tool_use":
-                preview = json.dumps(block.input)[:80]
-                print(f"  → {block.name}({preview}{'…' if len(json.dumps(block.input)) > 80 else ''})")
-                result = dispatch(block.name, block.input)
-                tool_results.append(
-                    {"type": "tool_result", "tool_use_id": block.id, "content": result}
-                )
-
-        messages.append({"role": "user", "content": tool_results})
+            return None
+
+        pending = [
+            entry if entry[2] is not None else _start_tool(entry[0], dispatch)
+            for entry in pending
+        ]
+        messages.append({"role": "user", "content": _finish_tools(pending)})
+
+        if final_input is not None:
+            print("Done.\n")
+            return final_input
@@ -1,25 +1,21 @@
 """
 Demo entry point.
 
-Runs both agents sequentially against sample data and demonstrates the
-paper trading gate flow. The investor profile from Agent 1 feeds into
-Agent 2, mirroring how the real app wires them together.
+Runs both agents against sample data and demonstrates the paper trading
+gate flow. The investor profile from Agent 1 feeds into Agent 2, mirroring
+how the real app wires them together. Agent 2 only needs the assessed level,
+so it starts in the background as soon as Agent 1 finishes and runs while
+the gate and paper trading steps and the rest of the report are done.
 """
 
-import json
-from dotenv import load_dotenv
+import functools
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
-load_dotenv()
 
-from assessment.agent import run_assessment_agent
-from assessment.tools import check_action_permission, create_paper_portfolio
-from portfolio.agent import run_portfolio_agent
-
-
-def separator(title: str) -> None:
-    print("\n" + "=" * 60)
-    print(title)
-    print("=" * 60)
+def separator(title: str, file=None) -> None:
+    print("\n" + "=" * 60, title, "=" * 60, sep="\n", file=file)
 
 
 # ── Sample survey answers ─────────────────────────────────────────────────────
@@ -41,68 +37,96 @@ SAMPLE_ANSWERS = {
 }
 
 if __name__ == "__main__":
-
-    # ── Agent 1: Assessment ───────────────────────────────────────────────────
-    separator("AGENT 1 — OPTIONS KNOWLEDGE ASSESSMENT")
-    profile = run_assessment_agent(SAMPLE_ANSWERS)
-
-    print(f"Level:          {profile['level']}")
-    print(f"Score:          {profile['raw_score']}  ({profile['weighted_score_pct']}% weighted)")
-    print(f"Strengths:      {len(profile['strengths'])} concepts")
-    print(f"Weaknesses:     {len(profile['weaknesses'])} concepts")
-    print(f"Available actions:")
-    for action in profile["available_actions"]:
-        print(f"  • {action}")
-
-    # ── Gate: beginner tries a blocked action ─────────────────────────────────
-    separator("ACTION GATE — Beginner attempts 'iron_condor'")
-
-    gate_result = check_action_permission("iron_condor", "beginner")
-    print(f"Allowed: {gate_result['allowed']}")
-    print(f"Required level: {gate_result['required_level']}")
-    print("\nAlternatives offered:")
-    for alt in gate_result["alternatives"]:
-        print(f"  [{alt['action']}]  {alt['label']}")
-        print(f"    {alt['description']}")
-
-    # Simulate user choosing paper trading
-    separator("USER CHOSE PAPER TRADING")
-    paper_result = create_paper_portfolio(
-        investor_profile=profile,
-        attempted_action="iron_condor",
-    )
-    paper = paper_result["paper_portfolio"]
-    print(f"Paper portfolio created: {paper_result['filepath']}")
-    print(f"Total value:    ${paper['total_value']:,.0f}")
-    print(f"Positions:      {len(paper['positions'])}")
-    print(f"Practicing:     {paper['attempted_action'].replace('_', ' ')}")
-    print("\nFirst 3 positions in paper portfolio:")
-    for pos in paper["positions"][:3]:
-        print(f"  {pos['ticker']:6s}  {pos['shares']:>4} shares @ ${pos['current_price']:,.2f}  (paper trades: {pos['paper_trades']})")
-
-    # ── Agent 2: Portfolio Construction ───────────────────────────────────────
-    separator("AGENT 2 — PORTFOLIO CONSTRUCTION")
-    plan = run_portfolio_agent(investor_level=profile["level"])
-
-    print(f"Level:          {plan['investor_level']}")
-    print(f"Portfolio:      ${plan['portfolio_summary']['total_value']:,.0f}")
-    print(f"CC eligible:    {plan['portfolio_summary']['covered_call_eligible_positions']}")
-
-    print("\nIncome strategies:")
-    for s in plan["strategy_recommendations"].get("income", []):
-        print(f"  {s['ticker']:6s} — {s['contracts']}x covered call  ~${s['est_monthly_premium_usd']:,.0f}/mo")
-
-    print("\nAccumulation strategies (building toward covered call eligibility):")
-    for s in plan["strategy_recommendations"].get("accumulation", [])[:3]:
-        print(f"  {s['ticker']:6s} — sell CSP @ {s['suggested_strike']}  ~${s['est_premium_usd']:,.0f} premium")
-
-    print("\nEstimated annual impact:")
-    impact = plan["estimated_annual_impact"]
-    print(f"  Gross income:     ${impact['gross_income_usd']:,.0f}")
-    print(f"  Protection cost:  ${impact['protection_cost_usd']:,.0f}")
-    print(f"  Net impact:       ${impact['net_impact_usd']:,.0f}  ({impact['net_impact_pct_of_portfolio']:.1f}% of portfolio)")
-
-    print("\nPriority actions:")
-    for action in plan.get("priority_actions", []):
-        print(f"  {action['rank']}. {action['ticker']} — {action['action']}")
-        print(f"     {action['specific_trade']}")
+    # Imported here so `import main` (e.g. for SAMPLE_ANSWERS) stays cheap.
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    from assessment.agent import gate_and_paper, run_assessment_agent
+    from portfolio.agent import run_portfolio_agent
+
+    # The report is collected here and written to stdout in one call at the
+    # end; only the agents' progress lines are printed as they happen.
+    buf = io.StringIO()
+    out = functools.partial(print, file=buf)
+
+    # The pool is shut down on the way out even if a report section raises.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Written in a finally so the sections already built still reach stdout
+        # if a later one fails.
+        try:
+            # ── Agent 1: Assessment ───────────────────────────────────────────
+            separator("AGENT 1 — OPTIONS KNOWLEDGE ASSESSMENT", file=buf)
+            profile = run_assessment_agent(SAMPLE_ANSWERS)
+
+            # Agent 2 depends only on the level — start it now, so it runs while
+            # the gate and paper steps and the rest of the report are done.
+            plan_future = pool.submit(run_portfolio_agent, investor_level=profile["level"])
+
+            combined = gate_and_paper(profile, "iron_condor")
+            gate_result, paper_result = combined["gate"], combined["paper"]
+
+            out(f"Level:          {profile['level']}")
+            out(f"Score:          {profile['raw_score']}  ({profile['weighted_score_pct']}% weighted)")
+            out(f"Strengths:      {len(profile['strengths'])} concepts")
+            out(f"Weaknesses:     {len(profile['weaknesses'])} concepts")
+            out(f"Available actions:")
+            for action in profile["available_actions"]:
+                out(f"  • {action}")
+
+            # ── Gate: the investor tries an advanced action ───────────────────
+            separator(f"ACTION GATE — {profile['level'].title()} attempts 'iron_condor'", file=buf)
+
+            notification = gate_result["notification"]
+            out(f"Notification:   {notification.level if notification else 'none'}")
+            if notification:
+                out(f"Headline:       {notification.headline}")
+                for gap in notification.gaps or ():
+                    out(f"  • {gap}")
+                out("\nSuggestions offered:")
+                for alt in notification.suggestions:
+                    out(f"  [{alt['action']}]  {alt['label']}")
+                    out(f"    {alt['description']}")
+
+            # Simulate user choosing paper trading
+            separator("USER CHOSE PAPER TRADING", file=buf)
+            paper = paper_result["paper_portfolio"]
+            out(f"Paper portfolio created: {paper_result['filepath']}")
+            out(f"Total value:    ${paper['total_value']:,.0f}")
+            out(f"Positions:      {len(paper['positions'])}")
+            out(f"Practicing:     {paper['attempted_action'].replace('_', ' ')}")
+            out("\nFirst 3 positions in paper portfolio:")
+            for pos in paper["positions"][:3]:
+                out(f"  {pos['ticker']:6s}  {pos['shares']:>4} shares @ ${pos['current_price']:,.2f}  (paper trades: {pos['paper_trades']})")
+
+            # ── Agent 2: Portfolio Construction ───────────────────────────────
+            separator("AGENT 2 — PORTFOLIO CONSTRUCTION", file=buf)
+            plan = plan_future.result()
+
+            if "error" in plan:
+                out(f"Error:          {plan['error']}")
+            else:
+                out(f"Level:          {plan['investor_level']}")
+                out(f"Portfolio:      ${plan['portfolio_summary']['total_value']:,.0f}")
+                out(f"CC eligible:    {plan['portfolio_summary']['covered_call_eligible_positions']}")
+
+                out("\nIncome strategies:")
+                for s in plan["strategy_recommendations"].get("income", []):
+                    out(f"  {s['ticker']:6s} — {s['contracts']}x covered call")
+                    out(f"    {s['eligibility_note']}")
+
+                out("\nAccumulation strategies (building toward covered call eligibility):")
+                for s in plan["strategy_recommendations"].get("accumulation", [])[:3]:
+                    out(f"  {s['ticker']:6s} — sell CSP  ({s['current_shares']} shares, {s['shares_to_goal']} to go)")
+
+                out("\nPosition sizing:")
+                sizing = plan["position_sizing_rules"]
+                out(f"  Per trade:        ${sizing['max_per_trade_usd']:,.0f}  ({sizing['max_per_trade_pct']}%)")
+                out(f"  Total exposure:   ${sizing['max_total_exposure_usd']:,.0f}  ({sizing['max_total_exposure_pct']}%)")
+
+                out("\nPriority actions:")
+                for action in plan.get("priority_actions", []):
+                    out(f"  {action['rank']}. {action['ticker']} — {action['action']}")
+                    out(f"     {action['rationale']}")
+        finally:
+            sys.stdout.write(buf.getvalue())
@@ -1,37 +1,73 @@
 """
 Portfolio construction agent: system prompt + agentic loop.
 
-Exactly 3 tool-call turns:
-  1. get_portfolio               → see all positions + contract availability
-  2. screen_options_opportunities → level-filtered strategy candidates per position
-  3. store_portfolio_plan         → persist the final construction plan
+Exactly 2 tool-call turns:
+  1. screen_options_opportunities → level-filtered strategy candidates per position
+  2. store_portfolio_plan         → persist the final construction plan
+
+The positions themselves are static, so they are rendered into the system
+prompt at import time instead of being fetched with get_portfolio (kept in
+TOOLS as a fallback).
 
 Claude's reasoning work — selecting strategies, sizing positions, estimating
-income/protection, writing priority actions — happens between turns 2 and 3.
+income/protection, writing priority actions — happens between turns 1 and 2.
 """
 
-import json
+import hashlib
+from pathlib import Path
+
+from core.jsonio import loads, write_json
+from core.runner import MODEL, run_agent
+from portfolio.positions import (
+    CC_ELIGIBLE,
+    CC_INELIGIBLE_COUNT,
+    ETF_VALUE,
+    PORTFOLIO,
+    POSITIONS,
+    STOCK_VALUE,
+    TOTAL_CONTRACTS,
+)
+from portfolio.tools import TOOLS, dispatch, write_plan
+
+
+def _portfolio_block() -> str:
+    """Markdown table of every position plus the precomputed aggregates."""
+    rows = "\n".join(
+        f"| {p.ticker} | {p.shares} | {p.price:.2f} | {p.market_value:,.2f} "
+        f"| {p.contracts_available} | {p.role} |"
+        for p in POSITIONS
+    )
+    return f"""═══ PORTFOLIO (static, already provided) ═══
+
+| ticker | shares | price | market_value | contracts_available | role |
+|---|---|---|---|---|---|
+{rows}
+
+total_value: {PORTFOLIO["total_value"]:,.2f}   etf_value: {ETF_VALUE:,.2f}   stock_value: {STOCK_VALUE:,.2f}
+covered_call_eligible (contracts_available > 0): {", ".join(CC_ELIGIBLE)}
+covered_call_ineligible_count: {CC_INELIGIBLE_COUNT}   total_contracts_available: {TOTAL_CONTRACTS}
+Covered calls require 100 shares per contract. All positions support protective puts
+(buying puts) regardless of share count.
+"""
 
-from core.runner import run_agent
-from portfolio.tools import TOOLS, dispatch
 
 SYSTEM_PROMPT = """You are a portfolio construction agent for Wealthsimple.
 
 Given an investor's $200k portfolio and their assessed knowledge level, you produce
 a concrete options overlay plan that enhances the portfolio without overcomplicating it.
 
-═══ WORKFLOW — exactly 3 tool calls ═══
+""" + _portfolio_block() + """
+═══ WORKFLOW — exactly 2 tool calls ═══
 
-CALL 1 — get_portfolio()
-  Understand every position: ticker, shares, price, market value, contracts_available.
-  Note which positions can write covered calls vs which fall short of 100 shares.
+The portfolio above is current — do not call get_portfolio.
+Note which positions can write covered calls vs which fall short of 100 shares.
 
-CALL 2 — screen_options_opportunities(investor_level)
+CALL 1 — screen_options_opportunities(investor_level)
   Get level-filtered opportunities: covered calls, protective puts, cash-secured puts.
   Read the constraint_notes — they explain real limitations (e.g., 9 of 10 stocks
   can't write covered calls because $2k positions don't reach 100 shares).
 
-REASONING — before call 3, build the plan:
+REASONING — before call 2, build the plan:
 
   Think through these dimensions:
 
@@ -62,7 +98,7 @@ REASONING — before call 3, build the plan:
     List 3–5 specific first steps ordered by role fit and simplicity.
     Each action: ticker, strategy, rationale — no specific strike or premium estimates.
 
-CALL 3 — store_portfolio_plan(plan)
+CALL 2 — store_portfolio_plan(plan)
   Build and store with this shape:
   {
     "investor_level": str,
@@ -119,6 +155,54 @@ CALL 3 — store_portfolio_plan(plan)
 """
 
 
+# The plan depends only on the investor level, the prompt and the model. Plans
+# are cached on disk in a .cache/ directory beside filepath (gitignored) as
+# <stem>.<level>.<hash8>.json, where hash8 fingerprints MODEL and SYSTEM_PROMPT
+# (which embeds the positions and the plan schema) — changing any of them
+# changes the name, so stale plans are never read. Delete the file to force a
+# fresh run.
+_PLAN_HASH = hashlib.sha1(f"{MODEL}\n{SYSTEM_PROMPT}".encode()).hexdigest()[:8]
+
+# Fields main.py reads from a plan, checked before a plan is cached or reused.
+_SUMMARY_KEYS = ("total_value", "covered_call_eligible_positions")
+_SIZING_KEYS = ("max_per_trade_pct", "max_total_exposure_pct", "max_per_trade_usd", "max_total_exposure_usd")
+_ITEM_KEYS = {
+    "income": ("ticker", "contracts", "eligibility_note"),
+    "accumulation": ("ticker", "current_shares", "shares_to_goal"),
+}
+_ACTION_KEYS = ("rank", "ticker", "action", "rationale")
+
+# Plans already loaded this session, keyed by (investor_level, filepath).
+_PLAN_CACHE: dict[tuple, dict] = {}
+
+
+def _plan_cache_path(investor_level: str, filepath: str) -> Path:
+    path = Path(filepath)
+    return path.parent / ".cache" / f"{path.stem}.{investor_level}.{_PLAN_HASH}{path.suffix}"
+
+
+def _is_complete(plan) -> bool:
+    """True if plan has every field the report reads, so it is safe to cache."""
+    try:
+        recs = plan["strategy_recommendations"]
+        return (
+            "investor_level" in plan
+            and all(k in plan["portfolio_summary"] for k in _SUMMARY_KEYS)
+            and all(k in plan["position_sizing_rules"] for k in _SIZING_KEYS)
+            and all(
+                all(k in item for k in keys)
+                for group, keys in _ITEM_KEYS.items()
+                for item in recs.get(group, ())
+            )
+            and all(
+                all(k in action for k in _ACTION_KEYS)
+                for action in plan.get("priority_actions", ())
+            )
+        )
+    except (KeyError, TypeError, AttributeError):
+        return False
+
+
 def run_portfolio_agent(
     investor_level: str,
     filepath: str = "profiles/portfolio_plan.json",
@@ -131,8 +215,24 @@ def run_portfolio_agent(
         filepath:       where to write the plan JSON
 
     Returns:
-        The portfolio construction plan dict (also written to filepath).
+        The portfolio construction plan dict (also written to filepath). A plan
+        cached for this level and portfolio is returned without running the
+        agent; filepath is still rewritten so it holds the plan just returned.
     """
+    cache_key = (investor_level, filepath)
+    cache_path = _plan_cache_path(investor_level, filepath)
+
+    plan = _PLAN_CACHE.get(cache_key)
+    if plan is None:
+        try:
+            plan = loads(cache_path.read_bytes())
+        except (FileNotFoundError, ValueError):
+            pass
+    if plan is not None and _is_complete(plan):
+        _PLAN_CACHE[cache_key] = plan
+        write_plan(plan, filepath)
+        return plan
+
     messages = [
         {
             "role": "user",
@@ -143,10 +243,24 @@ def run_portfolio_agent(
         }
     ]
 
-    run_agent(SYSTEM_PROMPT, TOOLS, dispatch, messages, label=f"portfolio ({investor_level})")
-
-    try:
-        with open(filepath) as f:
-            return json.load(f)
-    except FileNotFoundError:
+    # The run ends once the plan is stored — no turn to acknowledge the write.
+    stored = run_agent(
+        SYSTEM_PROMPT, TOOLS, dispatch, messages,
+        label=f"portfolio ({investor_level})",
+        final_tool="store_portfolio_plan",
+    )
+    if stored is None:
         return {"error": "Plan was not stored by the agent."}
+
+    # store_portfolio_plan already wrote this same dict (adding generated_at),
+    # so it is returned as-is rather than read back from disk. If the model
+    # stored it somewhere else, filepath is written here so it still holds
+    # the plan returned.
+    plan = stored["plan"]
+    if stored.get("filepath", "profiles/portfolio_plan.json") != filepath:
+        write_plan(plan, filepath)
+    if _is_complete(plan):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(cache_path, plan)
+        _PLAN_CACHE[cache_key] = plan
+    return plan
@@ -35,6 +35,23 @@ Position roles (used by portfolio agent to recommend strategy):
 Strategy gates and level ordering have moved to core/gates.py.
 """
 
+from dataclasses import dataclass
+from types import MappingProxyType
+
+
+@dataclass(frozen=True, slots=True)
+class Position:
+    ticker: str
+    name: str
+    theme: str
+    role: str
+    role_id: int                # ROLE_IDS[role]
+    shares: int
+    price: float
+    market_value: float
+    contracts_available: int
+    tier: str | None = None     # stocks only
+
 PORTFOLIO: dict = {
     "total_value": 200_000,
     "etfs": [
@@ -202,3 +219,51 @@ PORTFOLIO: dict = {
     ],
 }
 
+
+# Shared by every agent and UI page, so the top level and the position lists
+# are made read-only. The position dicts stay plain dicts so tool results that
+# include them still serialise as JSON.
+PORTFOLIO = MappingProxyType({
+    **PORTFOLIO,
+    "etfs": tuple(PORTFOLIO["etfs"]),
+    "stocks": tuple(PORTFOLIO["stocks"]),
+})
+
+# Flat views built once — PORTFOLIO does not change during a session.
+# ALL_POSITIONS keeps the ETFs-then-stocks order; ETF_IDS tells the two apart
+# by identity in O(1) without comparing position dicts.
+ALL_POSITIONS: tuple[dict, ...] = PORTFOLIO["etfs"] + PORTFOLIO["stocks"]
+ETF_IDS: frozenset[int] = frozenset(id(p) for p in PORTFOLIO["etfs"])
+
+# Position roles as small ints, for bit tests and column views.
+ROLE_ANCHOR, ROLE_HOLD_GROWTH, ROLE_INCOME_ETF, ROLE_SMALLCAP_VALUE, ROLE_INCOME_VALUE = range(5)
+ROLE_IDS = MappingProxyType({
+    "anchor": ROLE_ANCHOR,
+    "hold_growth": ROLE_HOLD_GROWTH,
+    "income_etf": ROLE_INCOME_ETF,
+    "smallcap_value": ROLE_SMALLCAP_VALUE,
+    "income_value": ROLE_INCOME_VALUE,
+})
+# Roles where covered calls should NOT be recommended regardless of eligibility
+NO_COVERED_CALL_ROLES = frozenset({"anchor", "hold_growth"})
+# Roles listed first, as "high" priority, among protective put candidates
+PRIORITY_PUT_ROLES = frozenset({"anchor", "hold_growth", "income_etf"})
+
+# The same sets as bitmasks over role ids: (NO_CC_MASK >> role_id) & 1.
+NO_CC_MASK: int = sum(1 << ROLE_IDS[r] for r in NO_COVERED_CALL_ROLES)
+PRIORITY_MASK: int = sum(1 << ROLE_IDS[r] for r in PRIORITY_PUT_ROLES)
+
+# Attribute-access records in the same order, for loops that only read fields.
+# Tool results keep returning the dicts above.
+POSITIONS: tuple[Position, ...] = tuple(
+    Position(**p, role_id=ROLE_IDS[p["role"]]) for p in ALL_POSITIONS
+)
+
+# Aggregates the tools would otherwise re-sum on every call.
+ETF_VALUE: float = sum(p["market_value"] for p in PORTFOLIO["etfs"])
+STOCK_VALUE: float = sum(p["market_value"] for p in PORTFOLIO["stocks"])
+CC_ELIGIBLE: tuple[str, ...] = tuple(
+    p["ticker"] for p in ALL_POSITIONS if p["contracts_available"] > 0
+)
+CC_INELIGIBLE_COUNT: int = len(ALL_POSITIONS) - len(CC_ELIGIBLE)
+TOTAL_CONTRACTS: int = sum(p["contracts_available"] for p in ALL_POSITIONS)
@@ -7,27 +7,44 @@ Three tools, one agent pass:
   3. store_portfolio_plan         — persists the construction plan JSON
 """
 
+import functools
+import hashlib
 import json
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
-from core.gates import STRATEGY_GATES, LEVEL_ORDER
-from portfolio.positions import PORTFOLIO
+from core.gates import LEVEL_NAMES, LEVEL_ORDER, STRATEGY_RANK
+from core.jsonio import dumps, write_json
+from portfolio.positions import (
+    ALL_POSITIONS,
+    CC_INELIGIBLE_COUNT,
+    ETF_VALUE,
+    NO_CC_MASK,
+    PORTFOLIO,
+    POSITIONS,
+    PRIORITY_MASK,
+    ROLE_HOLD_GROWTH,
+    ROLE_INCOME_VALUE,
+    STOCK_VALUE,
+    TOTAL_CONTRACTS,
+)
 
 
 # ─── Implementations ──────────────────────────────────────────────────────────
 
-def get_portfolio() -> dict:
-    """Returns the full portfolio with ETFs, stocks, and contract availability."""
-    all_positions = PORTFOLIO["etfs"] + PORTFOLIO["stocks"]
+def _build_portfolio_snapshot() -> dict:
     return {
         "total_value": PORTFOLIO["total_value"],
-        "etf_value": sum(p["market_value"] for p in PORTFOLIO["etfs"]),
-        "stock_value": sum(p["market_value"] for p in PORTFOLIO["stocks"]),
-        "positions": all_positions,
-        "covered_call_eligible": [
-            p for p in all_positions if p["contracts_available"] > 0
-        ],
+        "etf_value": ETF_VALUE,
+        "stock_value": STOCK_VALUE,
+        "positions": ALL_POSITIONS,
+        "covered_call_eligible": tuple(
+            p for p in ALL_POSITIONS if p["contracts_available"] > 0
+        ),
+        "covered_call_ineligible_count": CC_INELIGIBLE_COUNT,
+        "total_contracts_available": TOTAL_CONTRACTS,
         "note": (
             "Covered calls require 100 shares per contract. Only positions with "
             "contracts_available > 0 can write covered calls. All positions support "
@@ -36,6 +53,130 @@ def get_portfolio() -> dict:
     }
 
 
+# PORTFOLIO is static, so the tool result is built once at import.
+_PORTFOLIO_SNAPSHOT = _build_portfolio_snapshot()
+
+
+def get_portfolio() -> dict:
+    """
+    Returns the full portfolio with ETFs, stocks, and contract availability.
+
+    The same dict is returned on every call — treat it as read-only.
+    """
+    return _PORTFOLIO_SNAPSHOT
+
+
+@functools.lru_cache(maxsize=1)
+def _portfolio_payload() -> str:
+    """get_portfolio() serialised once — its result never changes."""
+    return dumps(get_portfolio())
+
+
+def _build_screen_tables() -> tuple:
+    """
+    Classify every position once. PORTFOLIO is static, so everything in the
+    screen except the level gating is fixed at import.
+    """
+    no_cc, priority = NO_CC_MASK, PRIORITY_MASK
+    cc_eligible, role_blocked, approaching, far_off = [], [], [], []
+    accumulation_targets, priority_puts, standard_puts = [], [], []
+    tickers, speculation = [], []
+    for p in POSITIONS:
+        role_id, shares = p.role_id, p.shares
+        cc_blocked = (no_cc >> role_id) & 1
+        if p.contracts_available > 0:
+            (role_blocked if cc_blocked else cc_eligible).append(p)
+        elif not cc_blocked:
+            # Short of 100 shares: "approaching" (≥50 shares) vs "far off" (<50)
+            (approaching if shares >= 50 else far_off).append(p)
+            # Best CSP targets: income_value positions approaching 100 shares
+            # (PLTR, WFC); too few shares = too far off
+            if role_id == ROLE_INCOME_VALUE and shares >= 30:
+                accumulation_targets.append(p)
+        (priority_puts if (priority >> role_id) & 1 else standard_puts).append(p)
+        tickers.append(p.ticker)
+        if role_id == ROLE_HOLD_GROWTH:
+            speculation.append(p.ticker)
+
+    covered_calls = tuple(
+        {"ticker": p.ticker, "role": p.role, "shares": p.shares, "contracts": p.contracts_available}
+        for p in cc_eligible
+    )
+
+    cc_notes = []
+    # Explain why share-eligible but role-inappropriate positions are excluded
+    if role_blocked:
+        cc_notes.append({
+            "strategy": "covered_calls",
+            "type": "role_conflict",
+            "note": (
+                f"{[p.ticker for p in role_blocked]} have enough shares for covered "
+                f"calls but are held as buy-and-hold anchor positions. Writing covered "
+                f"calls would cap their upside, conflicting with the holding thesis. "
+                f"Use protective puts instead."
+            ),
+        })
+    # Explain positions that fall short on share count
+    if approaching or far_off:
+        cc_notes.append({
+            "strategy": "covered_calls",
+            "type": "insufficient_shares",
+            "approaching_threshold": [
+                {"ticker": p.ticker, "shares": p.shares, "needed": 100 - p.shares}
+                for p in approaching
+            ],
+            "far_from_threshold": [
+                {"ticker": p.ticker, "shares": p.shares, "needed": 100 - p.shares}
+                for p in far_off
+            ],
+            "note": (
+                "Use cash-secured puts on 'approaching' positions to collect premium "
+                "while accumulating shares toward the 100-share covered call threshold."
+            ),
+        })
+
+    # Prioritise: anchor + hold_growth (these are the positions most worth protecting)
+    protective_puts = tuple(
+        {"ticker": p.ticker, "role": p.role, "position_value": p.market_value, "priority": priority}
+        for bucket, priority in ((priority_puts, "high"), (standard_puts, "standard"))
+        for p in bucket
+    )
+
+    cash_secured_puts = tuple(
+        {"ticker": p.ticker, "current_shares": p.shares, "shares_to_cc_threshold": 100 - p.shares}
+        for p in accumulation_targets
+    )
+
+    buy_calls_puts = {
+        "available_on": tickers,
+        "best_for_speculation": speculation,
+        "note": (
+            "Buying calls or puts is available on all positions. "
+            "Most useful for speculative plays on hold_growth positions "
+            "(NVDA, TSLA, META, SHOP, AMZN) where the risk is limited to the premium."
+        ),
+    }
+
+    return covered_calls, tuple(cc_notes), protective_puts, cash_secured_puts, buy_calls_puts
+
+
+# Strategies each level may use, e.g. "covered_calls" in _ALLOWED_BY_LEVEL["intermediate"].
+_ALLOWED_BY_LEVEL = MappingProxyType({
+    level: frozenset(s for s, rank in STRATEGY_RANK.items() if rank <= level_rank)
+    for level, level_rank in LEVEL_ORDER.items()
+})
+
+# Shared, read-only entries: each call gets fresh outer lists holding these dicts.
+(
+    _COVERED_CALLS,
+    _CC_CONSTRAINT_NOTES,
+    _PROTECTIVE_PUTS,
+    _CASH_SECURED_PUTS,
+    _BUY_CALLS_PUTS,
+) = _build_screen_tables()
+
+
+@functools.lru_cache(maxsize=8)
 def screen_options_opportunities(investor_level: str) -> dict:
     """
     For each position, determine which options strategies are appropriate given:
@@ -53,17 +194,12 @@ def screen_options_opportunities(investor_level: str) -> dict:
                                    calls — capping upside defeats the purpose of holding
       income_value (MSFT, PLTR…): covered calls where eligible; CSPs to accumulate
                                    toward 100-share threshold on PLTR and WFC
-    """
-    investor_rank = LEVEL_ORDER.get(investor_level, 0)
-    all_positions = PORTFOLIO["etfs"] + PORTFOLIO["stocks"]
-
-    def level_allowed(strategy: str) -> bool:
-        gate = STRATEGY_GATES.get(strategy, {})
-        required = gate.get("min_level", "advanced")
-        return investor_rank >= LEVEL_ORDER[required]
 
-    # Roles where covered calls should NOT be recommended regardless of eligibility
-    NO_COVERED_CALL_ROLES = {"anchor", "hold_growth"}
+    The result depends only on investor_level, so it is cached per level and
+    the same dict is returned on repeat calls — treat it as read-only.
+    """
+    # Unknown levels are screened as beginner.
+    allowed = _ALLOWED_BY_LEVEL.get(investor_level) or _ALLOWED_BY_LEVEL[LEVEL_NAMES[0]]
 
     opportunities: dict = {
         "investor_level": investor_level,
@@ -76,62 +212,9 @@ def screen_options_opportunities(investor_level: str) -> dict:
     }
 
     # ── Covered calls ──────────────────────────────────────────────────────────
-    if level_allowed("covered_calls"):
-        cc_eligible = [
-            p for p in all_positions
-            if p["contracts_available"] > 0 and p.get("role") not in NO_COVERED_CALL_ROLES
-        ]
-        role_blocked = [
-            p for p in all_positions
-            if p["contracts_available"] > 0 and p.get("role") in NO_COVERED_CALL_ROLES
-        ]
-
-        for p in cc_eligible:
-            opportunities["covered_calls"].append({
-                "ticker": p["ticker"],
-                "role": p.get("role"),
-                "shares": p["shares"],
-                "contracts": p["contracts_available"],
-            })
-
-        # Explain why share-eligible but role-inappropriate positions are excluded
-        if role_blocked:
-            opportunities["constraint_notes"].append({
-                "strategy": "covered_calls",
-                "type": "role_conflict",
-                "note": (
-                    f"{[p['ticker'] for p in role_blocked]} have enough shares for covered "
-                    f"calls but are held as buy-and-hold anchor positions. Writing covered "
-                    f"calls would cap their upside, conflicting with the holding thesis. "
-                    f"Use protective puts instead."
-                ),
-            })
-
-        # Explain positions that fall short on share count
-        share_ineligible = [
-            p for p in all_positions
-            if p["contracts_available"] == 0 and p.get("role") not in NO_COVERED_CALL_ROLES
-        ]
-        if share_ineligible:
-            # Separate into "approaching" (≥50 shares) vs "far off" (<50 shares)
-            approaching = [p for p in share_ineligible if p["shares"] >= 50]
-            far_off = [p for p in share_ineligible if p["shares"] < 50]
-            opportunities["constraint_notes"].append({
-                "strategy": "covered_calls",
-                "type": "insufficient_shares",
-                "approaching_threshold": [
-                    {"ticker": p["ticker"], "shares": p["shares"], "needed": 100 - p["shares"]}
-                    for p in approaching
-                ],
-                "far_from_threshold": [
-                    {"ticker": p["ticker"], "shares": p["shares"], "needed": 100 - p["shares"]}
-                    for p in far_off
-                ],
-                "note": (
-                    "Use cash-secured puts on 'approaching' positions to collect premium "
-                    "while accumulating shares toward the 100-share covered call threshold."
-                ),
-            })
+    if "covered_calls" in allowed:
+        opportunities["covered_calls"] = list(_COVERED_CALLS)
+        opportunities["constraint_notes"].extend(_CC_CONSTRAINT_NOTES)
     else:
         opportunities["blocked_strategies"].append({
             "strategy": "covered_calls",
@@ -140,16 +223,8 @@ def screen_options_opportunities(investor_level: str) -> dict:
         })
 
     # ── Protective puts ────────────────────────────────────────────────────────
-    if level_allowed("protective_puts"):
-        # Prioritise: anchor + hold_growth (these are the positions most worth protecting)
-        priority_roles = {"anchor", "hold_growth", "income_etf"}
-        for p in sorted(all_positions, key=lambda x: x.get("role", "") not in priority_roles):
-            opportunities["protective_puts"].append({
-                "ticker": p["ticker"],
-                "role": p.get("role"),
-                "position_value": p["market_value"],
-                "priority": "high" if p.get("role") in priority_roles else "standard",
-            })
+    if "protective_puts" in allowed:
+        opportunities["protective_puts"] = list(_PROTECTIVE_PUTS)
     else:
         opportunities["blocked_strategies"].append({
             "strategy": "protective_puts",
@@ -158,21 +233,8 @@ def screen_options_opportunities(investor_level: str) -> dict:
         })
 
     # ── Cash-secured puts ──────────────────────────────────────────────────────
-    if level_allowed("cash_secured_puts"):
-        # Best targets: income_value positions approaching 100 shares (PLTR, WFC)
-        accumulation_targets = [
-            p for p in all_positions
-            if p["contracts_available"] == 0
-            and p.get("role") == "income_value"
-            and p["shares"] >= 30      # worth pursuing; too few shares = too far off
-        ]
-        for p in accumulation_targets:
-            shares_needed = 100 - p["shares"]
-            opportunities["cash_secured_puts"].append({
-                "ticker": p["ticker"],
-                "current_shares": p["shares"],
-                "shares_to_cc_threshold": shares_needed,
-            })
+    if "cash_secured_puts" in allowed:
+        opportunities["cash_secured_puts"] = list(_CASH_SECURED_PUTS)
     else:
         opportunities["blocked_strategies"].append({
             "strategy": "cash_secured_puts",
@@ -181,46 +243,95 @@ def screen_options_opportunities(investor_level: str) -> dict:
         })
 
     # ── Buy calls/puts (available to everyone) ────────────────────────────────
-    if level_allowed("buy_calls_puts"):
-        opportunities["buy_calls_puts"] = {
-            "available_on": [p["ticker"] for p in all_positions],
-            "best_for_speculation": [
-                p["ticker"] for p in all_positions if p.get("role") == "hold_growth"
-            ],
-            "note": (
-                "Buying calls or puts is available on all positions. "
-                "Most useful for speculative plays on hold_growth positions "
-                "(NVDA, TSLA, META, SHOP, AMZN) where the risk is limited to the premium."
-            ),
-        }
+    if "buy_calls_puts" in allowed:
+        opportunities["buy_calls_puts"] = dict(_BUY_CALLS_PUTS)
 
     return opportunities
 
 
-def store_portfolio_plan(plan: dict, filepath: str = "profiles/portfolio_plan.json") -> dict:
-    """Persists the portfolio construction plan as a JSON file."""
+
+# filepath → (digest of the plan content, its generated_at) for the last write.
+_STORED: dict[str, tuple[str, str]] = {}
+
+
+def _plan_digest(plan: dict) -> str:
+    """Content fingerprint of a plan, ignoring generated_at."""
+    content = {k: v for k, v in plan.items() if k != "generated_at"}
+    return hashlib.sha1(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+
+def _write_plan(plan: dict, filepath: str, digest: str) -> None:
     Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    write_json(filepath, plan)  # atomic: the UI pages read this file
+    # Recorded only once the write has landed, so a failed write is retried.
+    _STORED[filepath] = (digest, plan.get("generated_at", ""))
+
+
+def write_plan(plan: dict, filepath: str) -> None:
+    """
+    Write an already-built plan to filepath as-is, keeping generated_at.
+
+    Any other writer of a plan file goes through here, so the unchanged
+    check in store_portfolio_plan always compares against what is on disk.
+    """
+    _write_plan(plan, filepath, _plan_digest(plan))
+
+
+def store_portfolio_plan(
+    plan: dict,
+    filepath: str = "profiles/portfolio_plan.json",
+) -> dict:
+    """
+    Persists the portfolio construction plan as a JSON file.
+
+    The write is atomic, so readers see either the previous file or the new
+    one. A plan identical to the one last written to filepath (ignoring
+    generated_at) is not rewritten; it keeps the earlier timestamp.
+    """
+    plan.pop("generated_at", None)
+    digest = _plan_digest(plan)
+    stored = _STORED.get(filepath)
+    if stored is not None and stored[0] == digest and Path(filepath).exists():
+        plan["generated_at"] = stored[1]
+        return {"success": True, "filepath": filepath, "unchanged": True}
+
     plan["generated_at"] = datetime.now().isoformat()
-    with open(filepath, "w") as f:
-        json.dump(plan, f, indent=2)
+    _write_plan(plan, filepath, digest)
     return {"success": True, "filepath": filepath}
 
 
 # ─── Dispatch ─────────────────────────────────────────────────────────────────
 
+# One handler per tool, each unpacking its own tool_input and returning the
+# serialised result — get_portfolio's payload is already a cached string.
+
+def _d_portfolio(ti: dict) -> str:
+    return _portfolio_payload()
+
+
+def _d_screen(ti: dict) -> str:
+    return dumps(screen_options_opportunities(ti["investor_level"]))
+
+
+def _d_store(ti: dict) -> str:
+    return dumps(store_portfolio_plan(
+        ti["plan"], ti.get("filepath", "profiles/portfolio_plan.json")
+    ))
+
+
+# Tool name → handler, built once; dispatch is a single dict lookup.
+_DISPATCH: dict[str, Callable[[dict], str]] = {
+    "get_portfolio": _d_portfolio,
+    "screen_options_opportunities": _d_screen,
+    "store_portfolio_plan": _d_store,
+}
+
+
 def dispatch(name: str, tool_input: dict) -> str:
-    if name == "get_portfolio":
-        result = get_portfolio()
-    elif name == "screen_options_opportunities":
-        result = screen_options_opportunities(tool_input["investor_level"])
-    elif name == "store_portfolio_plan":
-        result = store_portfolio_plan(
-            tool_input["plan"],
-            tool_input.get("filepath", "profiles/portfolio_plan.json"),
-        )
-    else:
-        result = {"error": f"Unknown tool: {name}"}
-    return json.dumps(result)
+    fn = _DISPATCH.get(name)
+    if fn is None:
+        return dumps({"error": f"Unknown tool: {name}"})
+    return fn(tool_input)
 
 
 # ─── Schemas ──────────────────────────────────────────────────────────────────
@@ -229,6 +340,8 @@ TOOLS = [
     {
         "name": "get_portfolio",
         "description": (
+            "Deprecated — the system prompt already contains this data; call only "
+            "if it is missing. "
             "Retrieve the investor's full $200k portfolio: 4 ETFs ($30k each) and "
             "10 individual stocks split across hold_growth ($6k each) and income_value "
             "($10k each) tiers. Includes share counts, current prices, market values, "
@@ -19,10 +19,10 @@ All insights are informational. The agent describes what the numbers
 show — it never prescribes a trade or expresses a preference between paths.
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 
-from anthropic import Anthropic
-from core.runner import run_agent
+from core.jsonio import dumps
+from core.runner import get_client, run_agent
 from situational.tools import TOOLS, dispatch
 
 SYSTEM_PROMPT = """You are a situational options analysis agent for Wealthsimple.
@@ -165,12 +165,12 @@ def run_situational_agent(
         portfolio_note = (
             f"\n\nHypothetical mode: evaluate portfolio impact of adding this position.\n"
             f"Existing positions:\n"
-            f"{json.dumps(existing_positions, indent=2)}"
+            f"{dumps(existing_positions)}"
         )
     elif portfolio_positions:
         portfolio_note = (
             f"\n\nPortfolio positions for Greeks aggregation:\n"
-            f"{json.dumps(portfolio_positions, indent=2)}"
+            f"{dumps(portfolio_positions)}"
         )
 
     messages = [
@@ -187,16 +187,18 @@ def run_situational_agent(
 
     run_agent(SYSTEM_PROMPT, TOOLS, dispatch, messages, label=f"situational ({ticker.upper()})")
 
-    # Extract the final text response from the assistant's last message
+    # Extract the final text response. run_agent appends turns, so the last
+    # assistant message is within the final few entries.
     insight = ""
-    for msg in reversed(messages):
+    for msg in messages[:-5:-1]:
         if msg.get("role") == "assistant":
             content = msg["content"]
             if isinstance(content, str):
                 insight = content
             elif isinstance(content, list):
-                texts = [b.text for b in content if hasattr(b, "text") and b.text]
-                insight = "\n\n".join(texts)
+                insight = "\n\n".join(
+                    text for b in content if (text := getattr(b, "text", None))
+                )
             if insight:
                 break
 
@@ -236,6 +238,31 @@ Never use imperative language. Never prescribe an action.
 """
 
 
+# Scenario rows kept for the zero-tool agents: the ±10% and flat moves.
+_KEY_MOVES = frozenset((-10, 0, 10))
+
+
+def _position_entry(pos: dict) -> dict:
+    """Compact, prompt-ready view of one position and its pre-computed analysis."""
+    analysis = pos.get("analysis", {})
+    return {
+        "ticker":      pos["ticker"],
+        "option_type": pos["option_type"],
+        "strike":      pos["strike"],
+        "expiry":      pos["expiry"],
+        "contracts":   pos["contracts"],
+        "entry_price": pos.get("entry_price", 0),
+        "sigma":       pos.get("sigma", 0),
+        "underlying":  analysis.get("underlying", {}),
+        "greeks":      analysis.get("greeks", {}),
+        "key_scenarios": [
+            row for row in analysis.get("scenario_grid", ())
+            if row.get("price_move_pct") in _KEY_MOVES
+        ],
+        "pnl_decomposition": analysis.get("pnl_decomposition", {}),
+    }
+
+
 def run_position_analysis_agent(
     position: dict,
     events: dict,
@@ -255,31 +282,15 @@ def run_position_analysis_agent(
     Returns:
         Insight string (150–250 words).
     """
-    analysis = position.get("analysis", {})
-    data = {
-        "ticker":      position["ticker"],
-        "option_type": position["option_type"],
-        "strike":      position["strike"],
-        "expiry":      position["expiry"],
-        "contracts":   position["contracts"],
-        "entry_price": position.get("entry_price", 0),
-        "sigma":       position.get("sigma", 0),
-        "underlying":  analysis.get("underlying", {}),
-        "greeks":      analysis.get("greeks", {}),
-        "key_scenarios": [
-            row for row in analysis.get("scenario_grid", [])
-            if row.get("price_move_pct") in (-10, 0, 10)
-        ],
-        "pnl_decomposition": analysis.get("pnl_decomposition", {}),
-        "events": events,
-    }
+    data = _position_entry(position)
+    data["events"] = events
 
     user_message = (
         f"Investor level: {investor_level}\n\n"
-        f"POSITION:\n{json.dumps(data, indent=2)}"
+        f"POSITION:\n{dumps(data)}"
     )
 
-    client = Anthropic()
+    client = get_client()
     response = client.messages.create(
         model="claude-sonnet-4-6",
         max_tokens=256,
@@ -289,6 +300,44 @@ def run_position_analysis_agent(
     return response.content[0].text
 
 
+# Upper bound on concurrent Agent 1 requests from one batch.
+_POSITION_BATCH_WORKERS = 8
+
+
+def run_position_analysis_agent_batch(
+    positions: list[dict],
+    events_by_ticker: dict,
+    investor_level: str = "intermediate",
+) -> list[str]:
+    """
+    Agent 1 insights for several positions at once.
+
+    Each position still gets its own run_position_analysis_agent request —
+    same prompt, same output as calling it in a loop — but the requests run
+    concurrently, so a stack costs about one round-trip instead of one per leg.
+
+    Args:
+        positions:        position dicts, as for run_position_analysis_agent.
+        events_by_ticker: {ticker: events_dict} pre-fetched from get_events.
+        investor_level:   'beginner' | 'intermediate' | 'advanced'
+
+    Returns:
+        Insight strings, parallel to positions.
+    """
+    if not positions:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(len(positions), _POSITION_BATCH_WORKERS),
+        thread_name_prefix="agent1",
+    ) as ex:
+        return list(ex.map(
+            lambda pos: run_position_analysis_agent(
+                pos, events_by_ticker.get(pos["ticker"], {}), investor_level,
+            ),
+            positions,
+        ))
+
+
 # ── Per-strategy analysis (same-expiry group, zero tool calls) ───────────────
 
 _STRATEGY_SYSTEM_PROMPT = """You are a multi-leg options strategy analyst for Wealthsimple.
@@ -384,11 +433,11 @@ def run_strategy_analysis_agent(
 
     user_message = (
         f"Investor level: {investor_level}\n\n"
-        f"STRATEGY DATA:\n{json.dumps(data, indent=2)}"
+        f"STRATEGY DATA:\n{dumps(data)}"
         f"{summaries_block}"
     )
 
-    client = Anthropic()
+    client = get_client()
     response = client.messages.create(
         model="claude-sonnet-4-6",
         max_tokens=384,
@@ -471,27 +520,7 @@ def run_stack_analysis_agent(
         The insight string.
     """
     # Build a compact, structured representation of each position
-    positions_data = []
-    for pos in positions:
-        analysis = pos.get("analysis", {})
-        entry = {
-            "ticker":      pos["ticker"],
-            "option_type": pos["option_type"],
-            "strike":      pos["strike"],
-            "expiry":      pos["expiry"],
-            "contracts":   pos["contracts"],
-            "entry_price": pos.get("entry_price", 0),
-            "sigma":       pos.get("sigma", 0),
-            "underlying":  analysis.get("underlying", {}),
-            "greeks":      analysis.get("greeks", {}),
-            # Condensed scenario: just the ±10% and flat rows
-            "key_scenarios": [
-                row for row in analysis.get("scenario_grid", [])
-                if row.get("price_move_pct") in (-10, 0, 10)
-            ],
-            "pnl_decomposition": analysis.get("pnl_decomposition", {}),
-        }
-        positions_data.append(entry)
+    positions_data = [_position_entry(pos) for pos in positions]
 
     # Build per-position summary block if Agent 1 outputs are provided
     summaries_block = ""
@@ -511,15 +540,15 @@ def run_stack_analysis_agent(
     user_message = (
         f"Investor level: {investor_level}\n\n"
         f"POSITION STACK ({len(positions)} position{'s' if len(positions) != 1 else ''}):\n"
-        f"{json.dumps(positions_data, indent=2)}\n\n"
+        f"{dumps(positions_data)}\n\n"
         f"PORTFOLIO GREEKS:\n"
-        f"{json.dumps(portfolio_summary, indent=2)}\n\n"
+        f"{dumps(portfolio_summary)}\n\n"
         f"EVENTS BY TICKER:\n"
-        f"{json.dumps(events_by_ticker, indent=2)}"
+        f"{dumps(events_by_ticker)}"
         f"{summaries_block}"
     )
 
-    client = Anthropic()
+    client = get_client()
     response = client.messages.create(
         model="claude-sonnet-4-6",
         max_tokens=1024,
@@ -651,10 +680,10 @@ def run_portfolio_impact_agent(
 
     user_message = (
         f"Investor level: {investor_level}\n\n"
-        f"PORTFOLIO IMPACT DATA:\n{json.dumps(data, indent=2)}"
+        f"PORTFOLIO IMPACT DATA:\n{dumps(data)}"
     )
 
-    client = Anthropic()
+    client = get_client()
     response = client.messages.create(
         model="claude-sonnet-4-6",
         max_tokens=512,
@@ -13,13 +13,33 @@ equity options with typical 30–90 DTE horizons.
 Chain filtering keeps only strikes within ±strike_range_pct of spot and
 the nearest max_expiries expiry dates. This caps what the agent sees to
 a manageable subset and avoids flooding the context with hundreds of rows.
+
+A single agent run asks about the same ticker several times (underlying,
+chain, events, position analysis), so Ticker objects and their .info
+payloads are reused for _CACHE_TTL seconds instead of being re-fetched.
 """
 
-from datetime import date, datetime
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 import yfinance as yf
 
 _FALLBACK_RF = 0.043   # ~4.3% — update manually if rates shift significantly
 
+_CACHE_TTL = 60.0      # seconds a Ticker / .info payload is reused
+_CACHE_MAX = 128
+
+_CHAIN_WORKERS = 8     # concurrent option_chain requests per get_option_chain call
+
+# symbol → (expires_at, value), oldest entry evicted first when full. Tools
+# run concurrently, so every read and write of these dicts holds _CACHE_LOCK.
+_CACHE_LOCK = threading.Lock()
+_TICKERS: dict[str, tuple[float, "yf.Ticker"]] = {}
+_INFOS: dict[str, tuple[float, dict]] = {}
+_RATES: dict[str, tuple[float, float]] = {}
+
 SECTOR_ETF = {
     "Technology":             "XLK",
     "Financial Services":     "XLF",
@@ -35,8 +55,43 @@ SECTOR_ETF = {
 }
 
 
-def _spot(ticker_obj) -> float:
-    info = ticker_obj.info
+def _cache_get(cache: dict, key: str):
+    with _CACHE_LOCK:
+        hit = cache.get(key)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+    return None
+
+
+def _cache_put(cache: dict, key: str, value) -> None:
+    with _CACHE_LOCK:
+        if len(cache) >= _CACHE_MAX and key not in cache:
+            cache.pop(next(iter(cache)))
+        cache[key] = (time.monotonic() + _CACHE_TTL, value)
+
+
+def get_ticker(symbol: str) -> "yf.Ticker":
+    """yf.Ticker for symbol, reused for _CACHE_TTL seconds."""
+    key = symbol.upper()
+    t = _cache_get(_TICKERS, key)
+    if t is None:
+        t = yf.Ticker(key)
+        _cache_put(_TICKERS, key, t)
+    return t
+
+
+def _info(symbol: str) -> dict:
+    """Ticker .info payload for symbol, reused for _CACHE_TTL seconds."""
+    key = symbol.upper()
+    info = _cache_get(_INFOS, key)
+    if info is None:
+        info = get_ticker(key).info
+        _cache_put(_INFOS, key, info)
+    return info
+
+
+def _spot(ticker: str) -> float:
+    info = _info(ticker)
     price = (
         info.get("currentPrice")
         or info.get("regularMarketPrice")
@@ -45,16 +100,26 @@ def _spot(ticker_obj) -> float:
     if price:
         return float(price)
     # fast_info fallback (works for ETFs too)
-    return float(ticker_obj.fast_info.get("last_price", 0))
+    return float(get_ticker(ticker).fast_info.get("last_price", 0))
 
 
 def get_risk_free_rate() -> float:
-    """13-week T-bill annualised yield, with hardcoded fallback."""
+    """
+    13-week T-bill annualised yield, with hardcoded fallback.
+
+    A fetched rate is reused for _CACHE_TTL seconds; the fallback is never
+    cached, so a transient ^IRX failure is retried on the next call.
+    """
+    rate = _cache_get(_RATES, "^IRX")
+    if rate is not None:
+        return rate
     try:
-        irx = yf.Ticker("^IRX")
-        rate = irx.fast_info.get("last_price")
-        if rate and rate > 0:
-            return round(float(rate) / 100, 5)
+        irx = get_ticker("^IRX")
+        last = irx.fast_info.get("last_price")
+        if last and last > 0:
+            rate = round(float(last) / 100, 5)
+            _cache_put(_RATES, "^IRX", rate)
+            return rate
     except Exception:
         pass
     return _FALLBACK_RF
@@ -65,13 +130,12 @@ def get_underlying_data(ticker: str) -> dict:
     Current price, beta, dividend yield, sector, and risk-free rate
     for a single underlying.
     """
-    t    = yf.Ticker(ticker)
-    info = t.info
+    info = _info(ticker)
     rf   = get_risk_free_rate()
 
     return {
         "ticker":        ticker.upper(),
-        "price":         round(_spot(t), 4),
+        "price":         round(_spot(ticker), 4),
         "beta":          float(info.get("beta") or 1.0),
         "dividend_yield": float(info.get("dividendYield") or 0.0),
         "sector":        info.get("sector", "Unknown"),
@@ -80,6 +144,32 @@ def get_underlying_data(ticker: str) -> dict:
     }
 
 
+def _parse_ymd(s: str) -> date:
+    """date for a 'YYYY-MM-DD' string (any time suffix ignored)."""
+    return date.fromisoformat(s[:10])
+
+
+_CHAIN_COLS   = ["strike", "bid", "ask", "impliedVolatility", "volume", "openInterest", "inTheMoney"]
+_CHAIN_KEYS   = ("strike", "bid", "ask", "iv", "volume", "oi", "itm")   # record keys, per _CHAIN_COLS
+
+
+def _near_money(frame, lo: float, hi: float) -> list[dict]:
+    """Rows of one side of a chain with lo <= strike <= hi, as records."""
+    strikes = frame["strike"].to_numpy()
+    sub  = frame.loc[(strikes >= lo) & (strikes <= hi), _CHAIN_COLS]
+    cols = {c: sub[c].tolist() for c in _CHAIN_COLS}
+    cols["impliedVolatility"] = sub["impliedVolatility"].round(4).tolist()
+    return [dict(zip(_CHAIN_KEYS, row)) for row in zip(*cols.values())]
+
+
+def _fetch_chain(t, expiry: str):
+    """t.option_chain(expiry), or None if Yahoo fails for that expiry."""
+    try:
+        return t.option_chain(expiry)
+    except Exception:
+        return None
+
+
 def get_option_chain(
     ticker: str,
     max_dte: int = 365,
@@ -91,45 +181,34 @@ def get_option_chain(
     Only strikes within ±strike_range_pct of current spot are included.
     Returns bid, ask, IV, volume, open interest, and ITM flag per contract.
     Days to expiry is pre-calculated for each expiry bucket.
+
+    Each expiry is a separate HTTPS request, so they are fetched
+    concurrently; expiries that fail are skipped.
     """
-    t     = yf.Ticker(ticker)
-    spot  = _spot(t)
+    t     = get_ticker(ticker)
+    spot  = _spot(ticker)
     lo    = spot * (1 - strike_range_pct)
     hi    = spot * (1 + strike_range_pct)
     today = date.today()
 
-    cols   = ["strike", "bid", "ask", "impliedVolatility", "volume", "openInterest", "inTheMoney"]
-    rename = {"impliedVolatility": "iv", "openInterest": "oi", "inTheMoney": "itm"}
-
     chain_out = {}
     eligible  = [
-        exp for exp in t.options
-        if (datetime.strptime(exp, "%Y-%m-%d").date() - today).days <= max_dte
+        (exp, dte) for exp in t.options
+        if (dte := (_parse_ymd(exp) - today).days) <= max_dte
     ]
-    for expiry in eligible:
-        try:
-            raw    = t.option_chain(expiry)
-            dte    = (datetime.strptime(expiry, "%Y-%m-%d").date() - today).days
-
-            calls  = (
-                raw.calls[cols]
-                .query("@lo <= strike <= @hi")
-                .rename(columns=rename)
-                .round({"iv": 4})
-                .to_dict("records")
-            )
-            puts   = (
-                raw.puts[cols]
-                .query("@lo <= strike <= @hi")
-                .rename(columns=rename)
-                .round({"iv": 4})
-                .to_dict("records")
-            )
+    raws = []
+    if eligible:
+        with ThreadPoolExecutor(max_workers=min(_CHAIN_WORKERS, len(eligible))) as ex:
+            raws = list(ex.map(functools.partial(_fetch_chain, t), [e for e, _ in eligible]))
 
+    for (expiry, dte), raw in zip(eligible, raws):
+        if raw is None:
+            continue
+        try:
             chain_out[expiry] = {
                 "days_to_expiry": dte,
-                "calls": calls,
-                "puts":  puts,
+                "calls": _near_money(raw.calls, lo, hi),
+                "puts":  _near_money(raw.puts, lo, hi),
             }
         except Exception:
             continue
@@ -142,6 +221,17 @@ def get_option_chain(
     }
 
 
+def _headline(item: dict) -> dict | None:
+    """{title, published} for one yfinance news item, or None if it has no title."""
+    # yfinance ≥0.2.x wraps content inside a "content" key
+    content = item.get("content") or item
+    title   = content.get("title") or content.get("headline")
+    if not title:
+        return None
+    pub = content.get("pubDate") or content.get("providerPublishTime", "")
+    return {"title": title, "published": pub[:10] if isinstance(pub, str) else str(pub)[:10]}
+
+
 def get_events(ticker: str) -> dict:
     """
     Upcoming events that affect option pricing for a given ticker.
@@ -153,8 +243,9 @@ def get_events(ticker: str) -> dict:
 
     All fields are optional — missing data is omitted rather than erroring.
     """
-    t    = yf.Ticker(ticker)
-    info = t.info
+    t     = get_ticker(ticker)
+    info  = _info(ticker)
+    today = date.today()
     events: dict = {}
 
     # Earnings ────────────────────────────────────────────────────────
@@ -171,8 +262,8 @@ def get_events(ticker: str) -> dict:
                 if hasattr(ed, "date"):
                     ed = ed.date()
                 elif isinstance(ed, str):
-                    ed = datetime.strptime(ed[:10], "%Y-%m-%d").date()
-                days_away = (ed - date.today()).days
+                    ed = _parse_ymd(ed)
+                days_away = (ed - today).days
                 events["earnings"] = {
                     "date":      str(ed),
                     "days_away": days_away,
@@ -186,7 +277,7 @@ def get_events(ticker: str) -> dict:
         ts = info.get("exDividendDate")
         if ts:
             ex_date   = date.fromtimestamp(int(ts))
-            days_away = (ex_date - date.today()).days
+            days_away = (ex_date - today).days
             events["ex_dividend"] = {
                 "date":      str(ex_date),
                 "days_away": days_away,
@@ -198,14 +289,7 @@ def get_events(ticker: str) -> dict:
     # Recent news headlines ────────────────────────────────────────────
     try:
         raw_news = t.news or []
-        headlines = []
-        for item in raw_news[:5]:
-            # yfinance ≥0.2.x wraps content inside a "content" key
-            content = item.get("content") or item
-            title   = content.get("title") or content.get("headline", "")
-            pub     = content.get("pubDate") or content.get("providerPublishTime", "")
-            if title:
-                headlines.append({"title": title, "published": str(pub)[:10]})
+        headlines = [h for item in raw_news[:5] if (h := _headline(item))]
         if headlines:
             events["recent_news"] = headlines
     except Exception:
@@ -18,9 +18,7 @@ Token efficiency strategy:
 
 import json
 
-import yfinance as yf
-
-from situational.data   import get_underlying_data, get_option_chain, get_events
+from situational.data   import get_underlying_data, get_option_chain, get_events, get_ticker
 from situational.greeks import (
     calculate_greeks,   # also used directly for theta_at_30dte
     run_scenario_analysis,
@@ -97,12 +95,12 @@ def _get_portfolio_greeks(positions: list) -> dict:
     """
     from datetime import date, datetime
 
-    spy_price = float(yf.Ticker("SPY").fast_info["last_price"])
+    spy_price = float(get_ticker("SPY").fast_info["last_price"])
 
+    today = date.today()
     enriched = []
     for pos in positions:
         und = get_underlying_data(pos["ticker"])
-        today = date.today()
         T = max(
             (datetime.strptime(pos["expiry"], "%Y-%m-%d").date() - today).days / 365,
             1e-8,
@@ -153,10 +151,11 @@ def dispatch(name: str, tool_input: dict) -> str:
             result = _get_portfolio_greeks(tool_input["positions"])
 
         elif name == "calculate_hypothetical_impact":
-            spy_price = float(yf.Ticker("SPY").fast_info["last_price"])
+            spy_price = float(get_ticker("SPY").fast_info["last_price"])
 
             # Enrich each position (existing + new) with live underlying data
             from datetime import date, datetime
+            today = date.today()
 
             def _enrich(pos: dict) -> dict:
                 und = get_underlying_data(pos["ticker"])
@@ -167,7 +166,7 @@ def dispatch(name: str, tool_input: dict) -> str:
                         "beta": pos.get("beta") or und["beta"],
                     }
                 T = max(
-                    (datetime.strptime(pos["expiry"], "%Y-%m-%d").date() - date.today()).days / 365,
+                    (datetime.strptime(pos["expiry"], "%Y-%m-%d").date() - today).days / 365,
                     1e-8,
                 )
                 return {
@@ -9,7 +9,7 @@ screen shows level, score, strengths, weaknesses, and unlocked actions.
 import streamlit as st
 
 from assessment.agent import run_assessment_agent
-from assessment.questions import QUESTIONS
+from assessment.questions import CHOICE_LETTERS, QUESTIONS
 
 _CATEGORY_LABELS = {
     "fundamental_safety":   "Fundamentals & Risk",
@@ -46,18 +46,18 @@ def _questionnaire() -> None:
     all_answered = True
 
     # Group questions by category in order
-    categories = list(dict.fromkeys(q["category"] for q in QUESTIONS.values()))
+    categories = list(dict.fromkeys(q.category for q in QUESTIONS))
 
     for cat in categories:
         st.subheader(_CATEGORY_LABELS.get(cat, cat))
-        qs = {k: v for k, v in QUESTIONS.items() if v["category"] == cat}
+        qs = [(n, q) for n, q in enumerate(QUESTIONS, 1) if q.category == cat]
 
-        for qnum, q in qs.items():
-            choice_labels = [f"{letter}. {text}" for letter, text in q["choices"].items()]
-            choice_keys   = list(q["choices"].keys())
+        for qnum, q in qs:
+            choice_labels = [f"{letter}. {text}" for letter, text in zip(CHOICE_LETTERS, q.choices)]
+            choice_keys   = CHOICE_LETTERS
 
             selection = st.radio(
-                label=f"**{qnum}.** {q['text']}",
+                label=f"**{qnum}.** {q.text}",
                 options=choice_labels,
                 index=None,
                 key=f"q{qnum}",
@@ -19,11 +19,12 @@ import streamlit as st
 from situational.tools import dispatch
 from situational.agent import (
     run_position_analysis_agent,
+    run_position_analysis_agent_batch,
     run_portfolio_impact_agent,
     run_stack_analysis_agent,
     run_strategy_analysis_agent,
 )
-from portfolio.positions import PORTFOLIO
+from portfolio.positions import ALL_POSITIONS
 from ui.components.charts import combined_payoff_chart, pnl_decomp_table, scenario_chart
 from ui.components.metrics import greeks_bar
 
@@ -67,7 +68,7 @@ def _equity_positions() -> list[dict]:
             "ticker":        item["ticker"],
             "shares":        item["shares"],
         }
-        for item in PORTFOLIO["etfs"] + PORTFOLIO["stocks"]
+        for item in ALL_POSITIONS
     ]
 
 
@@ -116,6 +117,23 @@ def _store_insight(key: str, insight: str) -> None:
     st.session_state["_insight_cache"][key] = insight
 
 
+def _ensure_insights(positions: list[dict], events_by_ticker: dict, investor_level: str) -> None:
+    """Set pos["insight"] on every position, fetching uncached ones in one Agent 1 batch."""
+    keys = [
+        _insight_key(p["ticker"], p["option_type"], p["strike"], p["expiry"], p["contracts"])
+        for p in positions
+    ]
+    # One request per distinct key — identical legs share an insight.
+    todo = {k: p for k, p in zip(keys, positions) if _cached_insight(k) is None}
+    fresh = run_position_analysis_agent_batch(
+        list(todo.values()), events_by_ticker, investor_level=investor_level,
+    )
+    for k, insight in zip(todo, fresh):
+        _store_insight(k, insight)
+    for k, p in zip(keys, positions):
+        p["insight"] = _cached_insight(k)
+
+
 def _run_analysis(
     option_type: str, ticker: str, strike: float, expiry: str,
     contracts: int, entry_price: float, sigma: float,
@@ -155,7 +173,7 @@ def _full_portfolio_greeks(options: list[dict]) -> dict | None:
     """Beta-weighted Greeks for the full book: equity holdings + options overlay."""
     equity = [
         {"position_type": "equity", "ticker": item["ticker"], "shares": item["shares"]}
-        for item in PORTFOLIO["etfs"] + PORTFOLIO["stocks"]
+        for item in ALL_POSITIONS
     ]
     option_rows = [
         {
@@ -177,10 +195,10 @@ def _equity_summary() -> list[dict]:
     live = st.session_state.get("live_prices", {})
     total_live = sum(
         (live.get(item["ticker"]) or item["price"]) * item["shares"]
-        for item in PORTFOLIO["etfs"] + PORTFOLIO["stocks"]
+        for item in ALL_POSITIONS
     )
     rows = []
-    for item in PORTFOLIO["etfs"] + PORTFOLIO["stocks"]:
+    for item in ALL_POSITIONS:
         price = live.get(item["ticker"]) or item["price"]
         mv    = price * item["shares"]
         rows.append({
@@ -189,7 +207,7 @@ def _equity_summary() -> list[dict]:
             "book_price":   item["price"],
             "market_value": round(mv, 0),
             "weight_pct":   round(mv / total_live * 100, 2) if total_live else 0,
-            "role":         item.get("role", ""),
+            "role":         item["role"],
         })
     return rows
 
@@ -255,7 +273,7 @@ def _chain_df(contracts: list[dict], spot: float) -> pd.DataFrame:
 # Flat lookup: ticker → portfolio item (shares + book price)
 _EQUITY_MAP: dict = {
     item["ticker"]: item
-    for item in PORTFOLIO["etfs"] + PORTFOLIO["stocks"]
+    for item in ALL_POSITIONS
 }
 
 
@@ -470,19 +488,9 @@ def _strategy_card(
             ):
                 # Agent 1: run for any leg without a cached insight
                 events_data = _load_events(ticker).get("events", {})
-                for pos in group:
-                    ikey = _insight_key(
-                        pos["ticker"], pos["option_type"],
-                        pos["strike"], pos["expiry"], pos["contracts"],
-                    )
-                    leg_insight = _cached_insight(ikey)
-                    if leg_insight is None:
-                        leg_insight = run_position_analysis_agent(
-                            pos, events_data.get("events", events_data),
-                            investor_level=investor_lvl,
-                        )
-                        _store_insight(ikey, leg_insight)
-                    pos["insight"] = leg_insight
+                _ensure_insights(
+                    group, {ticker: events_data.get("events", events_data)}, investor_lvl,
+                )
 
                 # Agent 2: strategy synthesis
                 stats      = _payoff_stats(group, spot, equity_shares, equity_entry)
@@ -879,20 +887,7 @@ def show() -> None:
                     if missing else "Synthesising position stack…"
                 ):
                     # Ensure every position has an Agent 1 insight
-                    for pos in missing:
-                        ikey = _insight_key(
-                            pos["ticker"], pos["option_type"],
-                            pos["strike"], pos["expiry"], pos["contracts"],
-                        )
-                        leg_insight = _cached_insight(ikey)
-                        if leg_insight is None:
-                            leg_insight = run_position_analysis_agent(
-                                pos,
-                                events_by_ticker.get(pos["ticker"], {}),
-                                investor_level=investor_lvl,
-                            )
-                            _store_insight(ikey, leg_insight)
-                        pos["insight"] = leg_insight
+                    _ensure_insights(missing, events_by_ticker, investor_lvl)
 
                     st.session_state["stack_analysis"] = run_stack_analysis_agent(
                         positions=positions,
@@ -943,20 +938,7 @@ def show() -> None:
                 missing = [p for p in positions if not p.get("insight")]
                 with st.spinner("Computing full portfolio impact…"):
                     # Ensure all positions have Agent 1 insights
-                    for pos in missing:
-                        ikey = _insight_key(
-                            pos["ticker"], pos["option_type"],
-                            pos["strike"], pos["expiry"], pos["contracts"],
-                        )
-                        leg_insight = _cached_insight(ikey)
-                        if leg_insight is None:
-                            leg_insight = run_position_analysis_agent(
-                                pos,
-                                events_by_ticker.get(pos["ticker"], {}),
-                                investor_level=investor_lvl,
-                            )
-                            _store_insight(ikey, leg_insight)
-                        pos["insight"] = leg_insight
+                    _ensure_insights(missing, events_by_ticker, investor_lvl)
 
                     # Full portfolio Greeks (equity + options)
                     full_greeks = _full_portfolio_greeks(positions)
@@ -965,7 +947,7 @@ def show() -> None:
                     live        = st.session_state.get("live_prices", {})
                     total_mv    = sum(
                         (live.get(item["ticker"]) or item["price"]) * item["shares"]
-                        for item in PORTFOLIO["etfs"] + PORTFOLIO["stocks"]
+                        for item in ALL_POSITIONS
                     )
 
                     st.session_state["portfolio_impact"] = run_portfolio_impact_agent(
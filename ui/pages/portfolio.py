@@ -8,7 +8,7 @@ import streamlit as st
 import yfinance as yf
 import pandas as pd
 
-from portfolio.positions import PORTFOLIO
+from portfolio.positions import ALL_POSITIONS, PORTFOLIO
 from situational.tools import dispatch as _events_dispatch
 
 
@@ -70,7 +70,7 @@ def _holdings_table(items: list, live: dict) -> pd.DataFrame:
 def show() -> None:
     st.title("Portfolio Dashboard")
 
-    all_items  = PORTFOLIO["etfs"] + PORTFOLIO["stocks"]
+    all_items  = ALL_POSITIONS
     tickers    = tuple(item["ticker"] for item in all_items)
     etf_tickers = {item["ticker"] for item in PORTFOLIO["etfs"]}
 